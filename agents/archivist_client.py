@@ -31,6 +31,22 @@ logger = setup_logger("ARCHIVIST_CLIENT")
 ARCHIVE_INDEX = "news_archive"
 NO_RESULTS_MESSAGE = "No results found"
 
+# Per-attempt request timeout (seconds)
+REQUEST_TIMEOUT = 60.0
+
+
+async def _post(
+    http_client: Optional[httpx.AsyncClient],
+    endpoint: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str]
+) -> httpx.Response:
+    """POST payload on the caller's pooled client, or on a one-off client when none is given"""
+    if http_client is not None:
+        return await http_client.post(endpoint, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        return await client.post(endpoint, json=payload, headers=headers)
+
 
 def extract_response_text(response_data: Any) -> str:
     """
@@ -172,7 +188,8 @@ async def converse(
     card_url: Optional[str] = None,
     api_key: str = None,
     max_retries: int = 10,
-    agent_id: str = None
+    agent_id: str = None,
+    http_client: Optional[httpx.AsyncClient] = None
 ) -> Dict[str, Any]:
     """
     Call the Archivist agent via /converse endpoint with retry logic.
@@ -187,6 +204,7 @@ async def converse(
         api_key: Elastic Archivist API key
         max_retries: Maximum number of retry attempts (default: 10)
         agent_id: Agent ID to chat with (overrides ID derived from URL)
+        http_client: Pooled client to send on (default: a new client per attempt)
 
     Returns:
         Dict with status, query, response, and conversation_id
@@ -230,19 +248,14 @@ async def converse(
     # Retry loop
     for attempt in range(1, max_retries + 1):
         try:
-            logger.info("Attempt %d/%d (timeout: 60s)", attempt, max_retries)
+            logger.debug("Attempt %d/%d (timeout: 60s)", attempt, max_retries)
             start_time = time.time()
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    endpoint,
-                    json=converse_request,
-                    headers=headers
-                )
+            response = await _post(http_client, endpoint, converse_request, headers)
 
             elapsed = time.time() - start_time
             response_text = response.text
-            logger.info("Archivist response received (Attempt %d) - Status: %d, Length: %d characters, Preview: %s", attempt, response.status_code, len(response_text), truncate_text(response_text, max_length=100))
+            logger.debug("Archivist response received (Attempt %d) - Status: %d, Length: %d characters, Preview: %s", attempt, response.status_code, len(response_text), truncate_text(response_text, max_length=100))
 
             # Check status
             response.raise_for_status()
@@ -314,7 +327,8 @@ async def send_task(
     agent_url: Optional[str] = None,
     card_url: Optional[str] = None,
     api_key: str = None,
-    max_retries: int = 10
+    max_retries: int = 10,
+    http_client: Optional[httpx.AsyncClient] = None
 ) -> Dict[str, Any]:
     """
     Call the Archivist agent via A2A JSONRPC protocol with retry logic.
@@ -328,6 +342,7 @@ async def send_task(
         card_url: Agent card URL (fallback if agent_url not set)
         api_key: Elastic Archivist API key
         max_retries: Maximum number of retry attempts (default: 10)
+        http_client: Pooled client to send on (default: a new client per attempt)
 
     Returns:
         Dict with status, query, response, message_id, and articles
@@ -389,19 +404,14 @@ async def send_task(
     # Retry loop
     for attempt in range(1, max_retries + 1):
         try:
-            logger.info("Attempt %d/%d (timeout: 60s)", attempt, max_retries)
+            logger.debug("Attempt %d/%d (timeout: 60s)", attempt, max_retries)
             start_time = time.time()
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    endpoint,
-                    json=a2a_request,
-                    headers=headers
-                )
+            response = await _post(http_client, endpoint, a2a_request, headers)
 
             elapsed = time.time() - start_time
             response_text = response.text
-            logger.info("Archivist response received (Attempt %d) - Status: %d, Length: %d characters, Preview: %s", attempt, response.status_code, len(response_text), truncate_text(response_text, max_length=100))
+            logger.debug("Archivist response received (Attempt %d) - Status: %d, Length: %d characters, Preview: %s", attempt, response.status_code, len(response_text), truncate_text(response_text, max_length=100))
 
             # Check status
             response.raise_for_status()
@@ -5,18 +5,31 @@ Provides common utilities and helper methods for all Elastic News agents.
 Reduces code duplication and ensures consistency across agents.
 """
 
-import json
+import asyncio
 import logging
 import os
+import time
+from contextlib import aclosing
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 import httpx
 from a2a.client import ClientFactory, ClientConfig, A2ACardResolver
 from a2a.types import AgentCard
-from utils import init_anthropic_client
+from utils import init_anthropic_client, strip_json_codeblocks, decode_json
 from utils.config import DEFAULT_MODEL
 from utils.mcp_client import create_mcp_client
 
+# Resolved agent cards are reused for this long before being fetched again
+AGENT_CARD_TTL_SECONDS = 300
+
+
+def response_text(response) -> Optional[str]:
+    """Return the text of the first part of an A2A response, or None if it carries none"""
+    parts = getattr(response, 'parts', None)
+    if not parts:
+        return None
+    return getattr(getattr(parts[0], 'root', None), 'text', None)
+
 
 class BaseAgent:
     """
@@ -43,6 +56,10 @@ class BaseAgent:
         self.mcp_client = None
         self.event_hub_url = os.getenv("EVENT_HUB_URL", "http://localhost:8090")
         self.event_hub_enabled = os.getenv("EVENT_HUB_ENABLED", "true").lower() == "true"
+        # agent_url -> (monotonic resolve time, card); see _get_agent_card
+        self._card_cache: Dict[str, Tuple[float, AgentCard]] = {}
+        # agent_url -> (card and HTTP client the A2A client was built from, A2A client)
+        self._a2a_clients: Dict[str, Tuple[AgentCard, httpx.AsyncClient, Any]] = {}
 
     # ===== Response Builders =====
 
@@ -75,6 +92,36 @@ class BaseAgent:
 
     # ===== A2A Communication Helpers =====
 
+    async def _get_agent_card(
+        self,
+        http_client: httpx.AsyncClient,
+        agent_url: str,
+        agent_name: str
+    ) -> AgentCard:
+        """
+        Return the agent card for agent_url, resolving it again once the cached
+        copy is older than AGENT_CARD_TTL_SECONDS.
+
+        Args:
+            http_client: HTTP client to use for discovery
+            agent_url: URL of the target agent
+            agent_name: Human-readable name for logging
+
+        Returns:
+            The target agent's card
+        """
+        now = time.monotonic()
+        cached = self._card_cache.get(agent_url)
+        if cached is not None and now - cached[0] < AGENT_CARD_TTL_SECONDS:
+            return cached[1]
+
+        self.logger.info("Discovering %s agent at %s", agent_name, agent_url)
+        card_resolver = A2ACardResolver(http_client, agent_url)
+        agent_card = await card_resolver.get_agent_card()
+        self.logger.info("Found %s: %s (v%s)", agent_name, agent_card.name, agent_card.version)
+        self._card_cache[agent_url] = (now, agent_card)
+        return agent_card
+
     async def _create_a2a_client(
         self,
         http_client: httpx.AsyncClient,
@@ -85,9 +132,10 @@ class BaseAgent:
         Create A2A client for communication with another agent.
 
         This method handles:
-        - Agent discovery via A2ACardResolver
+        - Agent discovery via A2ACardResolver (cached, see _get_agent_card)
         - Client configuration
-        - Client creation via ClientFactory
+        - Client creation via ClientFactory, reused while the card and
+          HTTP client are unchanged
 
         Args:
             http_client: HTTP client to use for communication
@@ -100,22 +148,29 @@ class BaseAgent:
         Raises:
             Exception: If agent discovery or client creation fails
         """
-        self.logger.info("Discovering %s agent at %s, creating A2A client", agent_name, agent_url)
-        card_resolver = A2ACardResolver(http_client, agent_url)
-        agent_card = await card_resolver.get_agent_card()
-        self.logger.info("Found %s: %s (v%s)", agent_name, agent_card.name, agent_card.version)
+        agent_card = await self._get_agent_card(http_client, agent_url, agent_name)
+        cached = self._a2a_clients.get(agent_url)
+        if cached is not None and cached[0] is agent_card and cached[1] is http_client:
+            return cached[2], agent_card
 
         client_config = ClientConfig(httpx_client=http_client, streaming=False)
         client_factory = ClientFactory(client_config)
         client = client_factory.create(agent_card)
+        self._a2a_clients[agent_url] = (agent_card, http_client, client)
 
         return client, agent_card
 
+    def _forget_agent(self, agent_url: str):
+        """Drop the cached card and client so the next call rediscovers the agent"""
+        self._card_cache.pop(agent_url, None)
+        self._a2a_clients.pop(agent_url, None)
+
     async def _parse_a2a_response(self, client, message) -> Optional[Dict[str, Any]]:
         """
         Parse JSON response from A2A client.
 
-        Iterates through response parts and extracts the first valid JSON response.
+        Returns on the first response that carries text; aclosing() then closes
+        the response stream (and releases its pooled connection) right away.
 
         Args:
             client: A2A client instance
@@ -124,12 +179,11 @@ class BaseAgent:
         Returns:
             Parsed JSON dictionary or None if no valid response
         """
-        async for response in client.send_message(message):
-            if hasattr(response, 'parts'):
-                part = response.parts[0]
-                text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
+        async with aclosing(client.send_message(message)) as responses:
+            async for response in responses:
+                text_content = response_text(response)
                 if text_content:
-                    return json.loads(text_content)
+                    return decode_json(text_content)
         return None
 
     # ===== Anthropic API Helpers =====
@@ -172,7 +226,10 @@ class BaseAgent:
             return fallback() if callable(fallback) else fallback
 
         try:
-            message = self.anthropic_client.messages.create(
+            # The sync client (one pooled connection set per agent) runs in a
+            # worker thread so concurrent requests keep the event loop free
+            message = await asyncio.to_thread(
+                self.anthropic_client.messages.create,
                 model=model,
                 max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}]
@@ -339,11 +396,7 @@ class BaseAgent:
         Returns:
             Cleaned JSON string
         """
-        if "```json" in text:
-            return text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            return text.split("```")[1].split("```")[0].strip()
-        return text
+        return strip_json_codeblocks(text)
 
     # ===== Event Hub Integration =====
 
@@ -398,11 +451,11 @@ class BaseAgent:
                 return True
 
         except httpx.TimeoutException:
-            self.logger.debug(f"Event Hub timeout for event: {event_type}")
+            self.logger.debug("Event Hub timeout for event: %s", event_type)
             return False
         except httpx.HTTPError as e:
-            self.logger.debug(f"Event Hub HTTP error: {e}")
+            self.logger.debug("Event Hub HTTP error: %s", e)
             return False
         except Exception as e:
-            self.logger.debug(f"Failed to publish event '{event_type}': {e}")
+            self.logger.debug("Failed to publish event '%s': %s", event_type, e)
             return False
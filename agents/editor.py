@@ -20,7 +20,7 @@ from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities
 from a2a.utils import new_agent_text_message
-from utils import setup_logger, load_env_config, init_anthropic_client, extract_json_from_llm_response, run_agent_server, format_json_for_log
+from utils import setup_logger, load_env_config, init_anthropic_client, extract_json_from_llm_response, run_agent_server, format_json_for_log, encode_json
 from agents.base_agent import BaseAgent
 
 # Load environment variables
@@ -336,7 +336,7 @@ class EditorAgentExecutor(AgentExecutor):
 
         # Send result as A2A message
         await event_queue.enqueue_event(
-            new_agent_text_message(json.dumps(result, indent=2))
+            new_agent_text_message(encode_json(result))
         )
 
     async def cancel(self, context, event_queue) -> None:
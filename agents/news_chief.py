@@ -5,14 +5,21 @@ The coordinator agent that assigns stories and oversees the newsroom workflow.
 Uses the official A2A SDK for agent communication.
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import os
+from collections import OrderedDict, defaultdict
+from contextlib import aclosing, asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 
 import click
 import httpx
+import msgspec
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.apps import A2AStarletteApplication
@@ -21,12 +28,38 @@ from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities
 from a2a.utils import new_agent_text_message
 from a2a.client import create_text_message_object
-from utils import setup_logger, run_agent_server, format_json_for_log
-from agents.base_agent import BaseAgent
+from utils import setup_logger, run_agent_server, format_json_for_log, encode_json, decode_json, JSONDecodeError, FastJSONResponse
+from agents.base_agent import BaseAgent, response_text
 
 # Configure logging using centralized utility
 logger = setup_logger("NEWS_CHIEF")
 
+# Polling actions that are excluded from debug logging to reduce log spam
+_STATUS_ACTIONS = frozenset({"get_status", "get_story_status", "list_active_stories"})
+
+# Retention policy for active_stories: hard cap (least recently updated finished
+# stories evicted first) plus periodic removal of finished stories that have
+# not changed recently
+MAX_ACTIVE_STORIES = int(os.getenv("NEWS_CHIEF_MAX_ACTIVE_STORIES", "1000"))
+STORY_RETENTION_SECONDS = int(os.getenv("NEWS_CHIEF_STORY_RETENTION_SECONDS", "3600"))
+STORY_GC_INTERVAL_SECONDS = 60
+TERMINAL_STORY_STATUSES = ("published", "completed", "error")
+
+# Upper bound on assignments sent to the Reporter in one accept_assignments call
+ASSIGNMENT_BATCH_MAX_SIZE = 20
+
+# Accepted values for a story assignment's priority
+VALID_PRIORITIES = ("low", "normal", "high", "urgent")
+
+
+class StoryRequest(msgspec.Struct, kw_only=True):
+    """Shape of the "story" payload of assign_story; msgspec checks types and fills defaults"""
+    topic: str = ""
+    angle: str = ""
+    target_length: int = 1000
+    deadline: Optional[str] = None
+    priority: str = "normal"
+
 
 class NewsChiefAgent(BaseAgent):
     """News Chief Agent - Coordinates newsroom workflow and assigns stories"""
@@ -35,13 +68,127 @@ class NewsChiefAgent(BaseAgent):
         # Initialize base agent with logger
         super().__init__(logger)
 
-        self.active_stories: Dict[str, Dict[str, Any]] = {}
-        self.available_reporters: List[str] = []
+        self.active_stories: Dict[str, Dict[str, Any]] = OrderedDict()
+        # Monotonic suffix so assignments within the same second get unique ids
+        self.story_counter = 0
+        # Secondary indexes (value -> ordered set of story_ids) kept in sync
+        # with active_stories so status/priority filters avoid full scans
+        self._by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_priority: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Insertion-ordered dict used as an ordered set: O(1) membership,
+        # first key is the first available reporter
+        self.available_reporters: Dict[str, None] = {}
         self.reporter_url = reporter_url or "http://localhost:8081"
         self.editor_url = editor_url or "http://localhost:8082"
         self.publisher_url = publisher_url or "http://localhost:8084"
-        self.reporter_client = None
-    
+
+        # Long-lived pooled HTTP client for story assignments; the Reporter card
+        # and A2A client are cached by BaseAgent and reused across assignments
+        self._http_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+
+        # Assignments waiting for the batcher; each carries the future its
+        # _send_to_reporter caller awaits for the Reporter's reply
+        self._pending_assignments: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_event = asyncio.Event()
+        self._batcher_task: Optional[asyncio.Task] = None
+
+        # Action name -> handler; dispatch() looks actions up here
+        self._handlers = {
+            "assign_story": self._assign_story,
+            "submit_draft": self._submit_draft,
+            "route_to_editor": self._route_to_editor,
+            "route_to_reporter": self._route_to_reporter,
+            "route_to_publisher": self._route_to_publisher,
+            "get_story_status": self._get_story_status,
+            "list_active_stories": self._list_active_stories,
+            "register_reporter": self._register_reporter,
+        }
+
+    async def aclose(self):
+        """Stop the assignment batcher and close the pooled HTTP client (called on application shutdown)"""
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            self._batcher_task = None
+        await self._http_client.aclose()
+        # Cached A2A clients were built on the pooled HTTP client just closed
+        self._a2a_clients.clear()
+
+    def _index_story(self, story: Dict[str, Any]):
+        """Add a newly created story to the status and priority indexes"""
+        story_id = story["story_id"]
+        self._by_status[story["status"]][story_id] = None
+        self._by_priority[story["priority"]][story_id] = None
+
+    def _transition_status(self, story_id: str, new_status: str):
+        """Update a story's status and updated_at, keeping the status index in sync"""
+        story = self.active_stories.get(story_id)
+        if story is None:
+            # Evicted by the retention policy while a request was in flight
+            return
+        self._by_status[story["status"]].pop(story_id, None)
+        story["status"] = new_status
+        # Retention of finished stories counts from their last transition, and
+        # active_stories stays ordered least recently updated first
+        story["updated_at"] = datetime.now().isoformat()
+        self.active_stories.move_to_end(story_id)
+        self._by_status[new_status][story_id] = None
+
+    def _forget_story(self, story_id: str):
+        """Remove a story from active_stories and the secondary indexes"""
+        story = self.active_stories.pop(story_id, None)
+        if story is not None:
+            self._by_status[story["status"]].pop(story_id, None)
+            self._by_priority[story["priority"]].pop(story_id, None)
+
+    def _enforce_story_limit(self):
+        """
+        Evict stories once active_stories exceeds MAX_ACTIVE_STORIES.
+
+        The least recently updated finished story goes first; an in-flight story
+        is only dropped when every story is still in progress, since its later
+        status callbacks would no longer find it.
+        """
+        while len(self.active_stories) > MAX_ACTIVE_STORIES:
+            # Each status index is ordered by transition time, so the oldest
+            # finished story is at the front of one of the terminal indexes
+            finished = [
+                next(iter(self._by_status[status]))
+                for status in TERMINAL_STORY_STATUSES
+                if self._by_status.get(status)
+            ]
+            if finished:
+                story_id = min(finished, key=lambda sid: self.active_stories[sid]["updated_at"])
+                self._forget_story(story_id)
+                logger.debug("Evicted finished story %s (active story limit %s reached)", story_id, MAX_ACTIVE_STORIES)
+            else:
+                story_id = next(iter(self.active_stories))
+                self._forget_story(story_id)
+                logger.warning("Evicted in-flight story %s: all %s active stories are still in progress", story_id, MAX_ACTIVE_STORIES)
+
+    def _purge_finished_stories(self) -> int:
+        """Drop finished stories not updated within STORY_RETENTION_SECONDS"""
+        cutoff = (datetime.now() - timedelta(seconds=STORY_RETENTION_SECONDS)).isoformat()
+        expired = [
+            story_id
+            for status in TERMINAL_STORY_STATUSES
+            for story_id in self._by_status.get(status, {})
+            if self.active_stories[story_id].get("updated_at", "") < cutoff
+        ]
+        for story_id in expired:
+            self._forget_story(story_id)
+        if expired:
+            logger.info("Purged %s finished stories older than %ss", len(expired), STORY_RETENTION_SECONDS)
+        return len(expired)
+
+    async def _gc_loop(self):
+        """Periodically purge finished stories (runs for the app lifetime)"""
+        while True:
+            await asyncio.sleep(STORY_GC_INTERVAL_SECONDS)
+            self._purge_finished_stories()
+
     async def invoke(self, query: str) -> Dict[str, Any]:
         """
         Main entry point for the agent. Processes a query and returns a result.
@@ -53,52 +200,56 @@ class NewsChiefAgent(BaseAgent):
             Dictionary with the result of the action
         """
         try:
-            # Only log non-status queries to reduce log spam
-            if not query.startswith('{"action": "get_status"') and not query.startswith('{"action": "get_story_status"') and not query.startswith('{"action": "list_active_stories"'):
-                logger.debug("Received query: %s", format_json_for_log(query))
-
             # Parse the query to determine the action
-            query_data = json.loads(query) if query.startswith('{') else {"action": "assign_story", "story": {"topic": query}}
+            query_data = decode_json(query) if query.startswith('{') else {"action": "assign_story", "story": {"topic": query}}
+        except JSONDecodeError as e:
+            return {
+                "status": "error",
+                "message": f"Invalid JSON in query: {str(e)}"
+            }
+
+        # Log the parsed dict (not the raw string, which format_json_for_log
+        # would decode a second time) and only when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG) and query_data.get("action", "assign_story") not in _STATUS_ACTIONS:
+            logger.debug("Received query: %s", format_json_for_log(query_data))
+
+        return await self.dispatch(query_data)
+
+    async def dispatch(self, query_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Route an already-parsed request to its action handler.
+
+        Used directly by the UI endpoints so HTTP bodies are not re-serialized
+        into a query string only to be parsed again by invoke().
+
+        Args:
+            query_data: Request dictionary with action and parameters
+
+        Returns:
+            Dictionary with the result of the action
+        """
+        try:
             action = query_data.get("action", "assign_story")
 
             # Only log non-status actions to reduce log spam
-            if action not in ["get_status", "get_story_status", "list_active_stories"]:
+            if action not in _STATUS_ACTIONS:
                 logger.debug("Action: %s", action)
 
-            if action == "assign_story":
-                return await self._assign_story(query_data)
-            elif action == "submit_draft":
-                return await self._submit_draft(query_data)
-            elif action == "route_to_editor":
-                return await self._route_to_editor(query_data)
-            elif action == "route_to_reporter":
-                return await self._route_to_reporter(query_data)
-            elif action == "route_to_publisher":
-                return await self._route_to_publisher(query_data)
-            elif action == "get_story_status":
-                return await self._get_story_status(query_data)
-            elif action == "list_active_stories":
-                return await self._list_active_stories(query_data)
-            elif action == "register_reporter":
-                return await self._register_reporter(query_data)
-            else:
+            handler = self._handlers.get(action)
+            if handler is None:
                 return {
                     "status": "error",
                     "message": f"Unknown action: {action}",
-                    "available_actions": ["assign_story", "submit_draft", "route_to_editor", "route_to_reporter", "route_to_publisher", "get_story_status", "list_active_stories", "register_reporter"]
+                    "available_actions": list(self._handlers)
                 }
+            return await handler(query_data)
 
-        except json.JSONDecodeError as e:
-            return {
-                "status": "error",
-                "message": f"Invalid JSON in query: {str(e)}"
-            }
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Error processing request: {str(e)}"
             }
-    
+
     async def _assign_story(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Assign a story to a reporter with input validation"""
         logger.debug("Processing story assignment...")
@@ -111,52 +262,76 @@ class NewsChiefAgent(BaseAgent):
                 "message": "No story data provided"
             }
 
-        # Validate topic (required)
-        topic = story_data.get("topic", "").strip()
+        # Check field types and apply defaults in a single msgspec call
+        try:
+            story = msgspec.convert(story_data, StoryRequest)
+        except msgspec.ValidationError as e:
+            return {
+                "status": "error",
+                "message": f"Invalid story data: {e}"
+            }
+
+        # Topic is required and must not be blank
+        topic = story.topic.strip()
         if not topic:
             return {
                 "status": "error",
                 "message": "Story topic is required"
             }
 
-        # Validate target_length (if provided)
-        target_length = story_data.get("target_length", 1000)
-        if not isinstance(target_length, int) or target_length <= 0:
+        target_length = story.target_length
+        if target_length <= 0:
             return {
                 "status": "error",
                 "message": "Invalid target_length: must be a positive integer"
             }
 
-        # Validate priority (if provided)
-        priority = story_data.get("priority", "normal")
-        valid_priorities = ["low", "normal", "high", "urgent"]
-        if priority not in valid_priorities:
+        priority = story.priority
+        if priority not in VALID_PRIORITIES:
             return {
                 "status": "error",
-                "message": f"Invalid priority: must be one of {valid_priorities}"
+                "message": f"Invalid priority: must be one of {list(VALID_PRIORITIES)}"
             }
 
-        # Create story assignment
-        story_id = f"story_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Deadline is optional (the UI sends "" when unset); a date or a
+        # datetime-local value such as 2025-01-31T17:00 is accepted
+        if story.deadline:
+            try:
+                datetime.fromisoformat(story.deadline)
+            except ValueError:
+                return {
+                    "status": "error",
+                    "message": "Invalid deadline: must be an ISO 8601 date or datetime (e.g. 2025-01-31 or 2025-01-31T17:00)"
+                }
+
+        angle = story.angle.strip()
+
+        # Create story assignment (single clock read for id and timestamps)
+        now = datetime.now()
+        now_iso = now.isoformat()
+        self.story_counter += 1
+        story_id = f"story_{now.strftime('%Y%m%d_%H%M%S')}_{self.story_counter:06d}"
         story_assignment = {
             "story_id": story_id,
             "topic": topic,
-            "angle": story_data.get("angle", "").strip(),
+            "angle": angle,
             "target_length": target_length,
-            "deadline": story_data.get("deadline"),
+            "deadline": story.deadline,
             "priority": priority,
             "assigned_to": None,
             "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
 
         # Assign to first available reporter (for now)
         if self.available_reporters:
-            story_assignment["assigned_to"] = self.available_reporters[0]
+            story_assignment["assigned_to"] = next(iter(self.available_reporters))
             story_assignment["status"] = "assigned"
 
         self.active_stories[story_id] = story_assignment
+        self._index_story(story_assignment)
+        self._enforce_story_limit()
 
         # Publish event: story assigned
         await self._publish_event(
@@ -166,18 +341,18 @@ class NewsChiefAgent(BaseAgent):
                 "topic": topic,
                 "priority": priority,
                 "target_length": target_length,
-                "angle": story_assignment.get("angle", "")
+                "angle": angle
             }
         )
 
-        logger.info("Story assigned: id=%s topic=%s status=%s", story_id, story_assignment['topic'], story_assignment['status'])
+        logger.info("Story assigned: id=%s topic=%s status=%s", story_id, topic, story_assignment['status'])
 
         # Send assignment to Reporter via A2A
         reporter_response = await self._send_to_reporter(story_assignment)
 
         return {
             "status": "success",
-            "message": f"Story '{story_assignment['topic']}' assigned successfully",
+            "message": f"Story '{topic}' assigned successfully",
             "story_id": story_id,
             "assignment": story_assignment,
             "reporter_response": reporter_response
@@ -205,11 +380,44 @@ class NewsChiefAgent(BaseAgent):
         }
     
     async def _list_active_stories(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """List all active stories"""
+        """List active stories one page at a time, optionally filtered by status/priority and projected to the requested fields"""
+        limit = request.get("limit", 100)
+        offset = request.get("offset", 0)
+        fields = request.get("fields") or ["story_id", "topic", "status", "priority", "updated_at"]
+
+        if not isinstance(limit, int) or limit <= 0:
+            return {
+                "status": "error",
+                "message": "Invalid limit: must be a positive integer"
+            }
+        if not isinstance(offset, int) or offset < 0:
+            return {
+                "status": "error",
+                "message": "Invalid offset: must be a non-negative integer"
+            }
+
+        # Narrow to matching ids via the secondary indexes when filtering
+        status_filter = request.get("status")
+        priority_filter = request.get("priority")
+        if status_filter or priority_filter:
+            matching_ids = self._by_status.get(status_filter, {}) if status_filter else self._by_priority.get(priority_filter, {})
+            if status_filter and priority_filter:
+                priority_ids = self._by_priority.get(priority_filter, {})
+                matching_ids = [story_id for story_id in matching_ids if story_id in priority_ids]
+            candidates = (self.active_stories[story_id] for story_id in matching_ids)
+            total_count = len(matching_ids)
+        else:
+            candidates = self.active_stories.values()
+            total_count = len(self.active_stories)
+
+        page = itertools.islice(candidates, offset, offset + limit)
+        stories = [{field: story.get(field) for field in fields} for story in page]
+
         return {
             "status": "success",
-            "stories": list(self.active_stories.values()),
-            "total_count": len(self.active_stories)
+            "stories": stories,
+            "total_count": total_count,
+            "next_offset": offset + limit if offset + limit < total_count else None
         }
     
     async def _register_reporter(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -222,13 +430,12 @@ class NewsChiefAgent(BaseAgent):
                 "message": "No reporter_id provided"
             }
 
-        if reporter_id not in self.available_reporters:
-            self.available_reporters.append(reporter_id)
+        self.available_reporters.setdefault(reporter_id, None)
 
         return {
             "status": "success",
             "message": f"Reporter {reporter_id} registered successfully",
-            "available_reporters": self.available_reporters
+            "available_reporters": list(self.available_reporters)
         }
 
     async def _submit_draft(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -254,8 +461,7 @@ class NewsChiefAgent(BaseAgent):
 
         # Update story with draft
         self.active_stories[story_id]["draft"] = draft
-        self.active_stories[story_id]["status"] = "draft_submitted"
-        self.active_stories[story_id]["updated_at"] = datetime.now().isoformat()
+        self._transition_status(story_id, "draft_submitted")
 
         logger.info("Draft submitted: story=%s word_count=%s", story_id, draft.get('word_count', 'N/A'))
 
@@ -282,8 +488,7 @@ class NewsChiefAgent(BaseAgent):
             }
         
         # Update story status
-        story["status"] = "under_review"
-        story["updated_at"] = datetime.now().isoformat()
+        self._transition_status(story_id, "under_review")
 
         # Publish event: editor review requested
         await self._publish_event(
@@ -305,31 +510,28 @@ class NewsChiefAgent(BaseAgent):
                     "action": "review_draft",
                     "draft": draft
                 }
-                message = create_text_message_object(content=json.dumps(review_request))
+                message = create_text_message_object(content=encode_json(review_request))
                 
                 # Get response
                 async for response in editor_client.send_message(message):
-                    if hasattr(response, 'parts'):
-                        part = response.parts[0]
-                        text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
-                        if text_content:
-                            review_result = json.loads(text_content)
-                            logger.debug("Editor review completed: %s", review_result.get("review", {}).get("approval_status"))
-
-                            # Store review
-                            story["editor_review"] = review_result
-                            story["status"] = "reviewed"
-                            story["updated_at"] = datetime.now().isoformat()
-
-                            # Auto-route back to Reporter if revisions needed
-                            if review_result.get("review", {}).get("approval_status") == "needs_minor_revisions":
-                                logger.info("Routed to Reporter: story=%s action=revisions", story_id)
-                                return await self._route_to_reporter({"story_id": story_id})
-                            else:
-                                # Ready for publication
-                                logger.info("Routed to Publisher: story=%s", story_id)
-                                return await self._route_to_publisher({"story_id": story_id})
-                            break
+                    text_content = response_text(response)
+                    if text_content:
+                        review_result = decode_json(text_content)
+                        logger.debug("Editor review completed: %s", review_result.get("review", {}).get("approval_status"))
+
+                        # Store review
+                        story["editor_review"] = review_result
+                        self._transition_status(story_id, "reviewed")
+
+                        # Auto-route back to Reporter if revisions needed
+                        if review_result.get("review", {}).get("approval_status") == "needs_minor_revisions":
+                            logger.info("Routed to Reporter: story=%s action=revisions", story_id)
+                            return await self._route_to_reporter({"story_id": story_id})
+                        else:
+                            # Ready for publication
+                            logger.info("Routed to Publisher: story=%s", story_id)
+                            return await self._route_to_publisher({"story_id": story_id})
+                        break
                 
                 return {
                     "status": "success",
@@ -355,8 +557,7 @@ class NewsChiefAgent(BaseAgent):
             }
         
         story = self.active_stories[story_id]
-        story["status"] = "needs_revision"
-        story["updated_at"] = datetime.now().isoformat()
+        self._transition_status(story_id, "needs_revision")
         
         # Send to Reporter for revisions
         try:
@@ -372,27 +573,24 @@ class NewsChiefAgent(BaseAgent):
                     "story_id": story_id,
                     "editor_review": story.get("editor_review", {})
                 }
-                message = create_text_message_object(content=json.dumps(revision_request))
+                message = create_text_message_object(content=encode_json(revision_request))
                 
                 # Get response
                 async for response in reporter_client.send_message(message):
-                    if hasattr(response, 'parts'):
-                        part = response.parts[0]
-                        text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
-                        if text_content:
-                            revision_result = json.loads(text_content)
-                            logger.debug("Revisions applied: %s", revision_result.get('status'))
-
-                            # Update story with revised draft
-                            if "draft" in revision_result:
-                                story["draft"] = revision_result["draft"]
-                                story["status"] = "revised"
-                                story["updated_at"] = datetime.now().isoformat()
-
-                                # Auto-route to Publisher
-                                logger.info("Routed to Publisher: story=%s", story_id)
-                                return await self._route_to_publisher({"story_id": story_id})
-                            break
+                    text_content = response_text(response)
+                    if text_content:
+                        revision_result = decode_json(text_content)
+                        logger.debug("Revisions applied: %s", revision_result.get('status'))
+
+                        # Update story with revised draft
+                        if "draft" in revision_result:
+                            story["draft"] = revision_result["draft"]
+                            self._transition_status(story_id, "revised")
+
+                            # Auto-route to Publisher
+                            logger.info("Routed to Publisher: story=%s", story_id)
+                            return await self._route_to_publisher({"story_id": story_id})
+                        break
                 
                 return {
                     "status": "success",
@@ -427,8 +625,7 @@ class NewsChiefAgent(BaseAgent):
             }
         
         # Update story status
-        story["status"] = "publishing"
-        story["updated_at"] = datetime.now().isoformat()
+        self._transition_status(story_id, "publishing")
 
         # Publish event: publication requested
         await self._publish_event(
@@ -450,30 +647,27 @@ class NewsChiefAgent(BaseAgent):
                     "action": "publish_article",
                     "article": draft
                 }
-                message = create_text_message_object(content=json.dumps(publish_request))
+                message = create_text_message_object(content=encode_json(publish_request))
                 
                 # Get response
                 async for response in publisher_client.send_message(message):
-                    if hasattr(response, 'parts'):
-                        part = response.parts[0]
-                        text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
-                        if text_content:
-                            publish_result = json.loads(text_content)
-                            logger.info("Article published: story=%s", story_id)
-
-                            # Update story status
-                            story["status"] = "published"
-                            story["published_at"] = datetime.now().isoformat()
-                            story["updated_at"] = datetime.now().isoformat()
-                            story["publication_result"] = publish_result
-
-                            return {
-                                "status": "success",
-                                "message": "Story published successfully",
-                                "story_id": story_id,
-                                "publication_result": publish_result
-                            }
-                            break
+                    text_content = response_text(response)
+                    if text_content:
+                        publish_result = decode_json(text_content)
+                        logger.info("Article published: story=%s", story_id)
+
+                        # Update story status
+                        self._transition_status(story_id, "published")
+                        story["published_at"] = datetime.now().isoformat()
+                        story["publication_result"] = publish_result
+
+                        return {
+                            "status": "success",
+                            "message": "Story published successfully",
+                            "story_id": story_id,
+                            "publication_result": publish_result
+                        }
+                        break
                 
                 return {
                     "status": "success",
@@ -505,83 +699,127 @@ class NewsChiefAgent(BaseAgent):
                     "action": "write_article",
                     "story_id": story_id
                 }
-                write_message = create_text_message_object(content=json.dumps(write_request))
+                write_message = create_text_message_object(content=encode_json(write_request))
 
                 async for response in reporter_client.send_message(write_message):
-                    if hasattr(response, 'parts'):
-                        part = response.parts[0]
-                        text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
-                        if text_content:
-                            write_result = json.loads(text_content)
-                            logger.debug("Background task: Write command completed: status=%s message=%s", write_result.get('status'), write_result.get('message'))
-
-                            # Update story status based on result
-                            if story_id in self.active_stories:
-                                if write_result.get('status') == 'success':
-                                    self.active_stories[story_id]['status'] = 'completed'
-                                    # Store article data for UI retrieval
-                                    if 'article_data' in write_result:
-                                        self.active_stories[story_id]['article_data'] = write_result['article_data']
-                                        logger.debug("Stored article data for story %s", story_id)
-                                else:
-                                    self.active_stories[story_id]['status'] = 'error'
-                            break
+                    text_content = response_text(response)
+                    if text_content:
+                        write_result = decode_json(text_content)
+                        logger.debug("Background task: Write command completed: status=%s message=%s", write_result.get('status'), write_result.get('message'))
+
+                        # Update story status based on result
+                        if story_id in self.active_stories:
+                            if write_result.get('status') == 'success':
+                                self._transition_status(story_id, "completed")
+                                # Store article data for UI retrieval
+                                if 'article_data' in write_result:
+                                    self.active_stories[story_id]['article_data'] = write_result['article_data']
+                                    logger.debug("Stored article data for story %s", story_id)
+                            else:
+                                self._transition_status(story_id, "error")
+                        break
         except Exception as e:
             logger.error("Background task error for story %s: %s", story_id, e)
             if story_id in self.active_stories:
-                self.active_stories[story_id]['status'] = 'error'
+                self._transition_status(story_id, "error")
 
-    async def _send_to_reporter(self, assignment: Dict[str, Any]) -> Dict[str, Any]:
-        """Send story assignment to Reporter agent via A2A"""
+    def start_assignment_batcher(self):
+        """Start the background task that flushes queued assignments to the Reporter"""
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = asyncio.create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        """
+        Flush queued assignments to the Reporter (runs for the app lifetime).
+
+        A lone assignment is sent as soon as it is queued, so idle latency is
+        unchanged; assignments that arrive while a dispatch is in flight are
+        collected and sent together in the next accept_assignments call.
+        """
+        while True:
+            await self._flush_event.wait()
+            self._flush_event.clear()
+            while self._pending_assignments:
+                batch = self._pending_assignments[:ASSIGNMENT_BATCH_MAX_SIZE]
+                del self._pending_assignments[:ASSIGNMENT_BATCH_MAX_SIZE]
+                await self._dispatch_assignment_batch(batch)
+
+    async def _dispatch_assignment_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Send a batch of assignments in one A2A message and resolve each caller's future"""
+        assignments = [assignment for assignment, _ in batch]
+        futures = [future for _, future in batch]
         try:
-            async with httpx.AsyncClient(timeout=60.0) as http_client:
-                # Create A2A client using BaseAgent helper
-                reporter_client, _ = await self._create_a2a_client(
-                    http_client, self.reporter_url, "Reporter"
-                )
+            # Reuse the pooled client and cached Reporter card
+            reporter_client, _ = await self._create_a2a_client(self._http_client, self.reporter_url, "Reporter")
 
-                # Send accept_assignment task to Reporter
-                request = {
-                    "action": "accept_assignment",
-                    "assignment": assignment
-                }
-                logger.info("Sending to Reporter: action=%s story=%s topic=%s", request['action'], assignment.get('story_id'), assignment.get('topic'))
+            if len(assignments) == 1:
+                request = {"action": "accept_assignment", "assignment": assignments[0]}
+            else:
+                request = {"action": "accept_assignments", "assignments": assignments}
+            logger.info("Sending to Reporter: action=%s stories=%s", request['action'], [a.get('story_id') for a in assignments])
+
+            message = create_text_message_object(content=encode_json(request))
+
+            # Get response for assignment acceptance; aclosing() releases the
+            # response stream (and its pooled connection) as soon as we break
+            reply = None
+            async with aclosing(reporter_client.send_message(message)) as responses:
+                async for response in responses:
+                    text_content = response_text(response)
+                    if text_content:
+                        reply = decode_json(text_content)
+                        logger.debug("Reporter response: status=%s message=%s", reply.get('status'), reply.get('message'))
+                        break
+
+            if len(assignments) == 1:
+                results = [reply]
+            elif reply and reply.get('status') == 'success':
+                results = reply.get('results', [])
+            else:
+                results = [reply] * len(assignments)
 
-                message = create_text_message_object(content=json.dumps(request))
+        except Exception as e:
+            logger.error("Failed to send assignments to Reporter: %s", e, exc_info=True)
+            # Drop the cached card and client so the next assignment rediscovers the Reporter
+            self._forget_agent(self.reporter_url)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for index, future in enumerate(futures):
+            if not future.done():
+                future.set_result(results[index] if index < len(results) else None)
 
-                # Get response for assignment acceptance
-                assignment_result = None
-                async for response in reporter_client.send_message(message):
-                    if hasattr(response, 'parts'):
-                        part = response.parts[0]
-                        text_content = part.root.text if hasattr(part, 'root') and hasattr(part.root, 'text') else None
-                        if text_content:
-                            assignment_result = json.loads(text_content)
-                            logger.debug("Reporter response: status=%s message=%s reporter_status=%s", assignment_result.get('status'), assignment_result.get('message'), assignment_result.get('reporter_status'))
-                            break
-
-                if not assignment_result:
-                    logger.warning("No response from Reporter")
-                    return {"status": "error", "message": "No response from Reporter"}
-
-                # If assignment was accepted, trigger the Reporter to start writing (async, don't wait)
-                if assignment_result.get('status') == 'success':
-                    # Update story status to 'writing'
-                    story_id = assignment.get('story_id')
-                    if story_id in self.active_stories:
-                        self.active_stories[story_id]['status'] = 'writing'
-
-                    # Send write_article command but don't wait for response
-                    # The Reporter will work asynchronously
-                    import asyncio
-
-                    # Fire and forget - don't wait for the response
-                    asyncio.create_task(self._trigger_write_async(story_id))
-
-                return assignment_result
+    async def _send_to_reporter(self, assignment: Dict[str, Any]) -> Dict[str, Any]:
+        """Send story assignment to Reporter agent via A2A (batched with concurrent assignments)"""
+        try:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_assignments.append((assignment, future))
+            self.start_assignment_batcher()
+            self._flush_event.set()
+            assignment_result = await future
+
+            if not assignment_result:
+                logger.warning("No response from Reporter")
+                return {"status": "error", "message": "No response from Reporter"}
+
+            # If assignment was accepted, trigger the Reporter to start writing (async, don't wait)
+            if assignment_result.get('status') == 'success':
+                # Update story status to 'writing'
+                story_id = assignment.get('story_id')
+                if story_id in self.active_stories:
+                    self._transition_status(story_id, "writing")
+
+                # Send write_article command but don't wait for response
+                # The Reporter will work asynchronously
+                # Fire and forget - don't wait for the response
+                asyncio.create_task(self._trigger_write_async(story_id))
+
+            return assignment_result
 
         except Exception as e:
-            logger.error("Failed to send assignment to Reporter: %s", e, exc_info=True)
+            logger.error("Failed to send assignment to Reporter: %s", e)
             return {
                 "status": "error",
                 "message": f"Failed to contact Reporter: {str(e)}"
@@ -615,7 +853,7 @@ class NewsChiefAgentExecutor(AgentExecutor):
 
         # Send result as A2A message
         await event_queue.enqueue_event(
-            new_agent_text_message(json.dumps(result, indent=2))
+            new_agent_text_message(encode_json(result))
         )
 
     async def cancel(self, context, event_queue) -> None:
@@ -624,8 +862,9 @@ class NewsChiefAgentExecutor(AgentExecutor):
 
 
 # Agent Card definition (single source of truth)
+@functools.lru_cache(maxsize=8)
 def create_agent_card(host: str, port: int) -> AgentCard:
-    """Create the News Chief agent card"""
+    """Create the News Chief agent card (memoized per host/port; treat as read-only)"""
     return AgentCard(
         name="News Chief",
         description="Coordinates newsroom workflow and assigns stories to specialized agents",
@@ -696,8 +935,9 @@ def create_agent_card(host: str, port: int) -> AgentCard:
                 description="Retrieves the status of assigned stories",
                 tags=["coordination", "status"],
                 examples=[
-                    '{"action": "get_story_status", "story_id": "story_20250107_120000"}',
-                    '{"action": "list_active_stories"}'
+                    '{"action": "get_story_status", "story_id": "story_20250107_120000_000001"}',
+                    '{"action": "list_active_stories"}',
+                    '{"action": "list_active_stories", "limit": 20, "offset": 40, "fields": ["story_id", "topic", "status"]}'
                 ]
             ),
             AgentSkill(
@@ -719,6 +959,19 @@ def create_agent_card(host: str, port: int) -> AgentCard:
     )
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Run the story retention loop and assignment batcher; release pooled HTTP connections on shutdown"""
+    agent = get_news_chief_agent()
+    gc_task = asyncio.create_task(agent._gc_loop())
+    agent.start_assignment_batcher()
+    try:
+        yield
+    finally:
+        gc_task.cancel()
+        await agent.aclose()
+
+
 def create_app(host='localhost', port=8080):
     """Factory function to create the A2A application"""
     # Create agent card using the single source of truth
@@ -736,7 +989,7 @@ def create_app(host='localhost', port=8080):
         http_handler=request_handler
     )
 
-    app = server.build()
+    app = server.build(lifespan=lifespan)
 
     # Add CORS middleware for React UI
     app.add_middleware(
@@ -747,45 +1000,32 @@ def create_app(host='localhost', port=8080):
         allow_headers=["*"],
     )
 
-    # Add minimal UI endpoints (simple wrappers around invoke())
-    from starlette.routing import Route
-    from starlette.responses import JSONResponse
+    # Compress large JSON bodies (e.g. /active-stories polling from the React UI)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-    async def ui_assign_story(request):
-        """UI endpoint for story assignment"""
-        try:
-            data = await request.json()
-            agent = get_news_chief_agent()
-            result = await agent.invoke(json.dumps(data))
-            return JSONResponse(result)
-        except Exception as e:
-            return JSONResponse({"status": "error", "message": str(e)}, status_code=500)
+    # Add minimal UI endpoints (a single wrapper around dispatch())
+    from starlette.routing import Route
 
-    async def ui_story_status(request):
-        """UI endpoint for story status"""
-        try:
-            data = await request.json()
-            agent = get_news_chief_agent()
-            result = await agent.invoke(json.dumps(data))
-            return JSONResponse(result)
-        except Exception as e:
-            return JSONResponse({"status": "error", "message": str(e)}, status_code=500)
+    # Default action for each UI route (used when the body omits "action")
+    ui_route_actions = {
+        "/assign-story": "assign_story",
+        "/story-status": "get_story_status",
+        "/active-stories": "list_active_stories",
+    }
 
-    async def ui_active_stories(request):
-        """UI endpoint for active stories list"""
+    async def ui_dispatch(request):
+        """UI endpoint for story assignment, story status and active stories list"""
         try:
-            data = await request.json()
-            agent = get_news_chief_agent()
-            result = await agent.invoke(json.dumps(data))
-            return JSONResponse(result)
+            data = decode_json(await request.body())
+            data.setdefault("action", ui_route_actions[request.url.path])
+            result = await get_news_chief_agent().dispatch(data)
+            return FastJSONResponse(result)
         except Exception as e:
-            return JSONResponse({"status": "error", "message": str(e)}, status_code=500)
+            return FastJSONResponse({"status": "error", "message": str(e)}, status_code=500)
 
     # Add UI routes
     app.router.routes.extend([
-        Route("/assign-story", ui_assign_story, methods=["POST"]),
-        Route("/story-status", ui_story_status, methods=["POST"]),
-        Route("/active-stories", ui_active_stories, methods=["POST"]),
+        Route(path, ui_dispatch, methods=["POST"]) for path in ui_route_actions
     ])
 
     return app
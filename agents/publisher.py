@@ -5,25 +5,31 @@ Publishes finalized articles to Elasticsearch and handles deployment workflow.
 Includes mock CI/CD and CRM notifications, but real Elasticsearch indexing.
 """
 
-import json
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
 import os
-import time
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+import aiofiles
 import click
+import msgspec
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import FileResponse
-from elasticsearch import Elasticsearch
-from elasticsearch.helpers import bulk
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities
 from a2a.utils import new_agent_text_message
-from utils import setup_logger, load_env_config, init_anthropic_client, run_agent_server, format_json_for_log
+from utils import setup_logger, load_env_config, init_anthropic_client, run_agent_server, format_json_for_log, encode_json, decode_json, JSONDecodeError
 from agents.base_agent import BaseAgent
 
 # Load environment variables
@@ -32,6 +38,102 @@ load_env_config()
 # Configure logging using centralized utility
 logger = setup_logger("PUBLISHER")
 
+# Publication records kept in memory for get_status (oldest evicted first)
+MAX_PUBLISHED_ARTICLES = int(os.getenv("PUBLISHER_MAX_PUBLISHED_ARTICLES", "10000"))
+
+# Largest query invoke() will parse; sized for bulk_publish batches of full articles
+MAX_QUERY_CHARS = int(os.getenv("PUBLISHER_MAX_QUERY_CHARS", str(16 * 1024 * 1024)))
+
+# Concurrent publishes are coalesced into _bulk requests bounded by these limits
+# (at least one document per request, or the indexer would never drain its queue)
+ES_BULK_CHUNK_SIZE = max(1, int(os.getenv("PUBLISHER_BULK_BATCH_SIZE", "500")))
+ES_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# Pooled Elasticsearch connections; never below the agent's max_concurrent_tasks (20)
+ES_POOL_SIZE = max(20, int(os.getenv("PUBLISHER_ES_POOL_SIZE", "25")))
+
+# Articles in a bulk_publish whose tags are generated concurrently
+BULK_PREPARE_CONCURRENCY = 8
+
+# Generated tags/categories are reused for identical (headline, topic, content) inputs
+TAG_CACHE_MAX_ENTRIES = 1024
+
+# Argument-free status polls as sent by json.dumps and by compact encoders;
+# these skip JSON parsing and dispatch entirely
+_STATUS_POLL_QUERIES = frozenset(('{"action": "get_status"}', '{"action":"get_status"}'))
+
+# Runs of characters not allowed in article filenames (collapsed to "-");
+# \w keeps letters and digits of any script, so non-English topics survive
+_SLUG_RE = re.compile(r'[^\w-]+')
+# An LLM-written "## Sources" section (to the end of the article)
+_SOURCES_SECTION_RE = re.compile(r'\n##\s+Sources\s*\n.*', re.DOTALL | re.IGNORECASE)
+
+# Article fields copied verbatim into the ES document, as (field, default);
+# computed fields and those with mutable defaults are set in _build_es_document
+_ES_COPIED_FIELDS = (
+    ("story_id", None),
+    ("headline", None),
+    ("content", None),
+    ("topic", None),
+    ("angle", None),
+    ("word_count", None),
+    ("target_length", None),
+    ("priority", "normal"),
+    ("created_at", None),
+    ("author", "Reporter Agent"),
+    ("editor", "Editor Agent"),
+    ("editorial_review", None),
+    ("archive_references", None),
+    ("url_slug", None),
+    ("filepath", None),
+    ("version", 1),
+    ("revisions_count", 0),
+)
+
+# agents_involved recorded when the article payload doesn't list them
+_DEFAULT_AGENTS_INVOLVED = ("News Chief", "Reporter", "Researcher", "Archivist", "Editor", "Publisher")
+
+# Markdown layout of the local article copy; _save_article_to_file writes the
+# article content and sources between these two without joining them into one string
+_ARTICLE_FRONTMATTER_TEMPLATE = """---
+title: {topic}
+story_id: {story_id}
+headline: {headline}
+author: Elastic News Reporter Agent
+date: {date}
+word_count: {word_count}
+tags: {tags}
+categories: {categories}
+---
+
+"""
+
+_ARTICLE_FOOTER_TEMPLATE = """
+---
+
+**Article Metadata:**
+- Story ID: {story_id}
+- Published: {published}
+- Word Count: {word_count}
+- Tags: {tags}
+- Categories: {categories}
+
+*Generated by Elastic News - A Multi-Agent AI Newsroom*
+*Powered by Anthropic Claude Sonnet 4 and A2A Protocol*
+"""
+
+class ArticleRequest(msgspec.Struct, kw_only=True):
+    """Schema for the core fields of a publish_article "article" payload (validated natively by msgspec)"""
+    story_id: str
+    headline: Optional[str] = None
+    word_count: Optional[int] = None
+
+
+def _parse_mcp_result(result: Any) -> Dict[str, Any]:
+    """Decode an MCP tool result, which arrives as JSON text/bytes or already parsed"""
+    return decode_json(result) if isinstance(result, (str, bytes)) else result
+
+
 # Singleton instance for maintaining state across requests
 _publisher_agent_instance = None
 
@@ -42,25 +144,54 @@ class PublisherAgent(BaseAgent):
         # Initialize base agent with logger
         super().__init__(logger)
 
-        self.published_articles: Dict[str, Dict[str, Any]] = {}
+        self.published_articles: Dict[str, Dict[str, Any]] = OrderedDict()
+        # Monotonic source of mock CI/CD build numbers
+        self._build_counter = itertools.count(1)
+        # LRU of content hash -> (tags, categories); see _generate_tags_and_categories
+        self._tag_cache: OrderedDict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = OrderedDict()
         self.es_client = None
         self.es_index = os.getenv("ELASTIC_ARCHIVIST_INDEX", "news_archive")
 
+        # Local markdown copies of published articles (created once, not per publish);
+        # point PUBLISHER_ARTICLES_DIR at fast local storage (e.g. tmpfs) on busy hosts
+        self.articles_dir = os.getenv("PUBLISHER_ARTICLES_DIR", "articles")
+        os.makedirs(self.articles_dir, exist_ok=True)
+
         # Initialize Elasticsearch client
         es_endpoint = os.getenv("ELASTICSEARCH_ENDPOINT")
         es_api_key = os.getenv("ELASTICSEARCH_API_KEY")
 
         if es_endpoint and es_api_key:
             try:
-                self.es_client = Elasticsearch(
+                # Imported here so processes without ES credentials never load
+                # the elasticsearch package (a large share of agent import time)
+                from elasticsearch import AsyncElasticsearch
+                from utils.es_serializer import msgspec_serializers
+
+                # Async client over httpx so ES round trips never block the
+                # event loop; the connection is verified lazily by
+                # _ensure_es_ready() before the first Elasticsearch operation.
+                # One pooled client is shared by every publish: the pool is
+                # sized to at least max_concurrent_tasks (20) so warm TLS
+                # connections are reused, and bulk bodies are gzip-compressed.
+                # Sniffing stays off (at startup and on node failure): Elastic
+                # Cloud sits behind a proxy, so the one node pool stays warm.
+                # Documents are encoded with msgspec rather than stdlib json
+                self.es_client = AsyncElasticsearch(
                     es_endpoint,
-                    api_key=es_api_key
+                    api_key=es_api_key,
+                    node_class="httpxasync",
+                    connections_per_node=ES_POOL_SIZE,
+                    http_compress=True,
+                    sniff_on_start=False,
+                    sniff_on_node_failure=False,
+                    request_timeout=30,
+                    retry_on_timeout=True,
+                    max_retries=3,
+                    serializers=msgspec_serializers()
                 )
-                # Test connection
-                info = self.es_client.info()
-                logger.debug("Connected to Elasticsearch version=%s index=%s", info['version']['number'], self.es_index)
             except Exception as e:
-                logger.error("Failed to connect to Elasticsearch: %s", e)
+                logger.error("Failed to create Elasticsearch client: %s", e)
                 self.es_client = None
         else:
             logger.warning("Elasticsearch credentials not configured")
@@ -73,6 +204,107 @@ class PublisherAgent(BaseAgent):
         # Initialize MCP client for tool calling
         self._init_mcp_client()
 
+        # Documents waiting for the bulk indexer; each carries the future its
+        # _index_article caller awaits for the per-document bulk result
+        self._pending_index: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._index_flush_event = asyncio.Event()
+        self._indexer_task: Optional[asyncio.Task] = None
+
+        # Action name -> handler; invoke() looks actions up here
+        self._handlers = {
+            "publish_article": self._publish_article,
+            "bulk_publish": self._bulk_publish,
+            "unpublish_article": self._unpublish_article,
+            "get_status": self._get_status,
+        }
+
+        # Set once the first Elasticsearch operation has verified the connection
+        self._es_ready = asyncio.Event()
+        self._es_probe_lock = asyncio.Lock()
+
+    async def _ensure_es_ready(self) -> bool:
+        """
+        Verify the Elasticsearch connection once, on first use rather than at startup.
+
+        Concurrent first requests share a single info() probe. A failed probe
+        disables indexing, as a failed connection check always has.
+
+        Returns:
+            True if the Elasticsearch client is available
+        """
+        if self._es_ready.is_set() or self.es_client is None:
+            return self.es_client is not None
+        async with self._es_probe_lock:
+            if self._es_ready.is_set() or self.es_client is None:
+                return self.es_client is not None
+            try:
+                info = await self.es_client.info()
+                logger.debug("Connected to Elasticsearch version=%s index=%s", info['version']['number'], self.es_index)
+                self._es_ready.set()
+            except Exception as e:
+                logger.error("Failed to connect to Elasticsearch: %s", e)
+                await self.es_client.close()
+                self.es_client = None
+        return self.es_client is not None
+
+    async def aclose(self):
+        """Stop the bulk indexer and close Elasticsearch connections (called on application shutdown)"""
+        if self._indexer_task is not None:
+            self._indexer_task.cancel()
+            self._indexer_task = None
+        if self.es_client is not None:
+            await self.es_client.close()
+
+    def start_indexer(self):
+        """Start the background task that flushes queued documents to Elasticsearch"""
+        if self._indexer_task is None or self._indexer_task.done():
+            self._indexer_task = asyncio.create_task(self._index_loop())
+
+    async def _index_loop(self):
+        """
+        Flush queued documents to Elasticsearch (runs for the app lifetime).
+
+        A lone publish is indexed as soon as it is queued; documents that
+        arrive while a bulk request is in flight go out together in the next.
+        """
+        while True:
+            await self._index_flush_event.wait()
+            self._index_flush_event.clear()
+            while self._pending_index:
+                batch = self._pending_index[:ES_BULK_CHUNK_SIZE]
+                del self._pending_index[:ES_BULK_CHUNK_SIZE]
+                await self._flush_index_batch(batch)
+
+    async def _flush_index_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Index a batch of documents in one bulk request and resolve each caller's future"""
+        from elasticsearch.helpers import async_streaming_bulk
+
+        futures = [future for _, future in batch]
+        try:
+            # streaming_bulk yields one (ok, item) per action in submission order
+            results = [
+                result async for result in async_streaming_bulk(
+                    self.es_client,
+                    [action for action, _ in batch],
+                    chunk_size=ES_BULK_CHUNK_SIZE,
+                    max_chunk_bytes=ES_BULK_MAX_CHUNK_BYTES,
+                    # Never force a per-request refresh; the index refresh interval governs visibility
+                    refresh=False,
+                    raise_on_error=False,
+                    raise_on_exception=False
+                )
+            ]
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("Bulk indexed batch of %s documents", len(batch))
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
     async def invoke(self, query: str) -> Dict[str, Any]:
         """
         Main entry point for the agent. Processes a query and returns a result.
@@ -83,47 +315,58 @@ class PublisherAgent(BaseAgent):
         Returns:
             Dictionary with the result of the action
         """
-        try:
-            # Only log non-status queries to reduce log spam
-            if not query.startswith('{"action": "get_status"'):
-                logger.info("Received query: %s", format_json_for_log(query))
+        # Status polls are the most frequent query; answer them directly
+        if query in _STATUS_POLL_QUERIES:
+            return await self._get_status({})
+
+        # Refuse pathological payloads before handing them to the JSON parser
+        if len(query) > MAX_QUERY_CHARS:
+            logger.error("Query rejected: %s characters exceeds limit of %s", len(query), MAX_QUERY_CHARS)
+            return {
+                "status": "error",
+                "message": f"Query too large: {len(query)} characters (limit {MAX_QUERY_CHARS})"
+            }
 
-            # Parse the query to determine the action
-            query_data = json.loads(query) if query.startswith('{') else {"action": "status"}
+        try:
+            # Parse the query once to determine the action
+            query_data = decode_json(query) if query[:1] == '{' else {"action": "status"}
             action = query_data.get("action")
 
-            # Only log non-status actions to reduce log spam
-            if action != "get_status":
+            # Only log non-status queries to reduce log spam; the pretty-printed
+            # query is only built when INFO records are actually emitted
+            if action != "get_status" and logger.isEnabledFor(logging.INFO):
+                logger.info("Received query: %s", format_json_for_log(query_data))
                 logger.info("Action: %s", action)
 
-            if action == "publish_article":
-                return await self._publish_article(query_data)
-            elif action == "bulk_publish":
-                return await self._bulk_publish(query_data)
-            elif action == "unpublish_article":
-                return await self._unpublish_article(query_data)
-            elif action == "get_status":
-                return await self._get_status(query_data)
-            else:
+            handler = self._handlers.get(action)
+            if handler is None:
                 return {
                     "status": "error",
                     "message": f"Unknown action: {action}",
-                    "available_actions": ["publish_article", "bulk_publish", "unpublish_article", "get_status"]
+                    "available_actions": list(self._handlers)
                 }
+            return await handler(query_data)
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             logger.error("Invalid JSON in query: %s", e)
             return {
                 "status": "error",
                 "message": f"Invalid JSON in query: {str(e)}"
             }
         except Exception as e:
-            logger.error("Error processing request: %s", e, exc_info=True)
+            logger.error("Error processing request: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "status": "error",
                 "message": f"Error processing request: {str(e)}"
             }
 
+    def _record_publication(self, story_id: str, record: Dict[str, Any]):
+        """Store a publication record as the most recent, evicting the oldest past MAX_PUBLISHED_ARTICLES"""
+        self.published_articles[story_id] = record
+        self.published_articles.move_to_end(story_id)
+        if len(self.published_articles) > MAX_PUBLISHED_ARTICLES:
+            self.published_articles.popitem(last=False)
+
     def _sanitize_research_data(self, research_data: list) -> list:
         """Sanitize research_data so it matches the ES mapping.
 
@@ -157,8 +400,6 @@ class PublisherAgent(BaseAgent):
 
     async def _publish_article(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Publish article to Elasticsearch with CI/CD and CRM workflow"""
-        logger.info("Processing article publication")
-
         article_data = request.get("article")
         if not article_data:
             logger.error("No article data provided")
@@ -167,40 +408,76 @@ class PublisherAgent(BaseAgent):
                 "message": "No article data provided"
             }
 
-        story_id = article_data.get("story_id")
-
-        # Publish event: publication started
-        await self._publish_event(
-            event_type="publication_started",
-            story_id=story_id,
-            data={
-                "headline": article_data.get("headline"),
-                "word_count": article_data.get("word_count")
+        # Validate the fields the workflow relies on in a single msgspec call;
+        # the full payload dict is still used for the ES document and file
+        try:
+            article = msgspec.convert(article_data, ArticleRequest, strict=False)
+        except msgspec.ValidationError as e:
+            logger.error("Invalid article data: %s", e)
+            return {
+                "status": "error",
+                "message": f"Invalid article data: {e}"
             }
-        )
 
-        logger.debug("Publishing story=%s headline=%s words=%s", story_id, article_data.get('headline', 'N/A')[:60], article_data.get('word_count'))
+        story_id = article.story_id
+
+        # Tag generation (an MCP round trip) needs only the payload, so it runs
+        # while the start event is posted and Elasticsearch is checked
+        tags_task = asyncio.create_task(self._generate_tags_and_categories(article_data))
+
+        try:
+            # Publish event: publication started
+            await self._publish_event(
+                event_type="publication_started",
+                story_id=story_id,
+                data={
+                    "headline": article.headline,
+                    "word_count": article.word_count
+                }
+            )
+
+            logger.info("Publishing story=%s headline=%.60s words=%s", story_id, article.headline or 'N/A', article.word_count)
+
+            # Check Elasticsearch connection (verified on first use)
+            es_ready = await self._ensure_es_ready()
+        except BaseException:
+            tags_task.cancel()
+            await asyncio.gather(tags_task, return_exceptions=True)
+            raise
 
-        # Check Elasticsearch connection
-        if not self.es_client:
+        if not es_ready:
+            # Nothing will be published; stop tag generation and reap the task
+            tags_task.cancel()
+            await asyncio.gather(tags_task, return_exceptions=True)
             logger.error("Elasticsearch not available")
             return {
                 "status": "error",
                 "message": "Elasticsearch not configured or unavailable"
             }
 
-        # Generate tags and categories
-        logger.debug("Generating tags and categories")
-        tags, categories = await self._generate_tags_and_categories(article_data)
+        # One timezone-aware UTC timestamp for the publication record, markdown
+        # file and ES document (naive local times would be read as UTC by ES)
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+
+        # Tags and categories (usually ready by now)
+        tags, categories = await tags_task
         logger.debug("Tags: %s Categories: %s", tags, categories)
 
         # Build Elasticsearch document
-        logger.debug("Building Elasticsearch document")
-        es_document = self._build_es_document(article_data, tags, categories)
+        es_document = self._build_es_document(article_data, tags, categories, now_iso)
+
+        # ALWAYS save to local file first (fallback if Elasticsearch fails); a
+        # failed write stops the publish before anything is indexed or announced
+        file_path = await self._save_article_to_file(article_data, tags, categories, now)
 
-        # ALWAYS save to local file first (fallback if Elasticsearch fails)
-        file_path = await self._save_article_to_file(article_data, tags, categories)
-        logger.info("Article saved to file: %s", file_path)
+        # Index to Elasticsearch (CRITICAL STEP), deploy via CI/CD and notify
+        # subscribers via CRM concurrently; each of these handles its own errors
+        es_response, (deployment_result, notification_result) = await asyncio.gather(
+            self._index_article(story_id, es_document),
+            self._deploy_and_notify(story_id, article_data)
+        )
+        es_success = es_response is not None
 
         # Publish event: file saved
         await self._publish_event(
@@ -209,47 +486,11 @@ class PublisherAgent(BaseAgent):
             data={"file_path": file_path}
         )
 
-        # Index to Elasticsearch - CRITICAL STEP
-        es_success = False
-        es_response = None
-        logger.info("Indexing article to Elasticsearch index=%s", self.es_index)
-        try:
-            es_response = self.es_client.index(
-                index=self.es_index,
-                id=story_id,  # Use story_id as document ID
-                document=es_document,
-                refresh="wait_for"  # Ensure article is immediately searchable
-            )
-            logger.debug("Article indexed result=%s id=%s", es_response['result'], es_response['_id'])
-            es_success = True
-
-            # Publish event: elasticsearch indexed
-            await self._publish_event(
-                event_type="elasticsearch_indexed",
-                story_id=story_id,
-                data={
-                    "index": self.es_index,
-                    "document_id": es_response['_id']
-                }
-            )
-
-        except Exception as e:
-            logger.error("Elasticsearch indexing failed: %s", e, exc_info=True)
-            logger.warning("Article saved to local file but not indexed to Elasticsearch")
-            # Don't return error - continue with local file publication
-            es_success = False
-
-        # CI/CD Deployment via MCP tool
-        deployment_result = await self._deploy_to_production(story_id, article_data)
-
-        # CRM Notification via MCP tool
-        notification_result = await self._notify_subscribers(story_id, article_data)
-
         # Store publication record
         publication_record = {
             "story_id": story_id,
-            "headline": article_data.get("headline"),
-            "published_at": datetime.now().isoformat(),
+            "headline": article.headline,
+            "published_at": now_iso,
             "file_path": file_path,
             "es_index": self.es_index if es_success else None,
             "es_document_id": es_response['_id'] if es_success else None,
@@ -260,7 +501,7 @@ class PublisherAgent(BaseAgent):
             "categories": categories,
             "elasticsearch_indexed": es_success
         }
-        self.published_articles[story_id] = publication_record
+        self._record_publication(story_id, publication_record)
 
         # Publish event: publication completed
         await self._publish_event(
@@ -272,15 +513,16 @@ class PublisherAgent(BaseAgent):
             }
         )
 
-        if es_success:
-            logger.info("Publication workflow completed successfully (Elasticsearch + Local File)")
-        else:
-            logger.info("Publication workflow completed (Local File Only - Elasticsearch indexing failed)")
-        logger.debug("Total published articles: %s", len(self.published_articles))
+        # One summary record per publish instead of a line per step
+        logger.info(
+            "Publication workflow completed story=%s file=%s elasticsearch_indexed=%s build=%s subscribers=%s total_published=%s",
+            story_id, file_path, es_success, publication_record["build_number"],
+            publication_record["subscribers_notified"], len(self.published_articles)
+        )
 
         result = {
             "status": "success",
-            "message": f"Article '{article_data.get('headline')}' published successfully",
+            "message": f"Article '{article.headline}' published successfully",
             "story_id": story_id,
             "published_at": publication_record["published_at"],
             "file_path": file_path,
@@ -303,6 +545,53 @@ class PublisherAgent(BaseAgent):
 
         return result
 
+    async def _index_article(self, story_id: str, es_document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Index a document to Elasticsearch, returning the ES response or None on failure"""
+        try:
+            # Queue for the bulk indexer so concurrent publishes share one request
+            future = asyncio.get_running_loop().create_future()
+            # A story this publisher has already published (a republish, or an
+            # unpublish followed by a republish) is overwritten on purpose; new
+            # story_ids use "create", which skips the version lookup and refuses
+            # to clobber a document indexed by someone else
+            op_type = "index" if story_id in self.published_articles else "create"
+            action = {
+                "_op_type": op_type,
+                "_index": self.es_index,
+                "_id": story_id,  # Use story_id as document ID
+                "_source": es_document
+            }
+            self._pending_index.append((action, future))
+            self.start_indexer()
+            self._index_flush_event.set()
+
+            ok, item = await future
+            es_response = item.get(op_type, {})
+            if not ok and es_response.get("status") == 409:
+                # An unknown story_id is already indexed: leave that document
+                # alone and report this publish as not indexed
+                logger.warning("Story %s is already indexed; existing document kept, new version not indexed", story_id)
+                return None
+            if not ok:
+                raise Exception(es_response.get("error") or item)
+            logger.debug("Article indexed index=%s result=%s id=%s", self.es_index, es_response['result'], es_response['_id'])
+
+            # Publish event: elasticsearch indexed
+            await self._publish_event(
+                event_type="elasticsearch_indexed",
+                story_id=story_id,
+                data={
+                    "index": self.es_index,
+                    "document_id": es_response['_id']
+                }
+            )
+            return es_response
+
+        except Exception as e:
+            logger.error("Elasticsearch indexing failed (article saved to local file only): %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            # Don't return error - continue with local file publication
+            return None
+
     async def _unpublish_article(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Unpublish article from Elasticsearch (set status to unpublished)"""
         logger.info("Processing article unpublish request")
@@ -315,29 +604,31 @@ class PublisherAgent(BaseAgent):
                 "message": "No story_id provided"
             }
 
-        # Check Elasticsearch connection
-        if not self.es_client:
+        # Check Elasticsearch connection (verified on first use)
+        if not await self._ensure_es_ready():
             logger.error("Elasticsearch not available")
             return {
                 "status": "error",
                 "message": "Elasticsearch not configured or unavailable"
             }
 
+        unpublished_at = datetime.now(timezone.utc).isoformat()
+
         # Update document status in Elasticsearch
         try:
             logger.debug("Updating article status in Elasticsearch story=%s", story_id)
-            response = self.es_client.update(
+            response = await self.es_client.update(
                 index=self.es_index,
                 id=story_id,
                 doc={
                     "status": "unpublished",
-                    "unpublished_at": datetime.now().isoformat()
+                    "unpublished_at": unpublished_at
                 }
             )
             logger.debug("Article status updated result=%s", response['result'])
 
         except Exception as e:
-            logger.error("Failed to update Elasticsearch: %s", e, exc_info=True)
+            logger.error("Failed to update Elasticsearch: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "status": "error",
                 "message": f"Failed to unpublish article: {str(e)}",
@@ -346,19 +637,19 @@ class PublisherAgent(BaseAgent):
 
         # Mock CI/CD - Remove from production
         logger.debug("[MOCK CI/CD] Removing from production")
-        time.sleep(1)
+        await asyncio.sleep(1)
         logger.debug("[MOCK CI/CD] Article removed from production")
 
         # Update local record
         if story_id in self.published_articles:
             self.published_articles[story_id]["status"] = "unpublished"
-            self.published_articles[story_id]["unpublished_at"] = datetime.now().isoformat()
+            self.published_articles[story_id]["unpublished_at"] = unpublished_at
 
         return {
             "status": "success",
             "message": f"Article unpublished successfully",
             "story_id": story_id,
-            "unpublished_at": datetime.now().isoformat()
+            "unpublished_at": unpublished_at
         }
 
     async def _bulk_publish(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -369,41 +660,51 @@ class PublisherAgent(BaseAgent):
         if not articles:
             return {"status": "error", "message": "No articles provided for bulk publish"}
 
-        if not self.es_client:
+        if not await self._ensure_es_ready():
             return {"status": "error", "message": "Elasticsearch not configured or unavailable"}
 
-        # Build bulk actions
+        # Build bulk actions; tag generation (one MCP round trip per article)
+        # runs concurrently, bounded so a large batch doesn't flood the MCP server
         actions = []
         results = {"succeeded": [], "failed": []}
+        semaphore = asyncio.Semaphore(BULK_PREPARE_CONCURRENCY)
+
+        async def prepare(article_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                tags, categories = await self._generate_tags_and_categories(article_data)
+            return {
+                "_index": self.es_index,
+                "_id": article_data["story_id"],
+                "_source": self._build_es_document(article_data, tags, categories)
+            }
 
+        valid_articles = []
         for article_data in articles:
-            story_id = article_data.get("story_id")
-            if not story_id:
+            if not article_data.get("story_id"):
                 results["failed"].append({"error": "Missing story_id", "article": article_data.get("headline", "unknown")})
-                continue
-
-            try:
-                tags, categories = await self._generate_tags_and_categories(article_data)
-                es_document = self._build_es_document(article_data, tags, categories)
+            else:
+                valid_articles.append(article_data)
 
-                actions.append({
-                    "_index": self.es_index,
-                    "_id": story_id,
-                    "_source": es_document
-                })
-            except Exception as e:
-                logger.error("Failed to prepare article %s: %s", story_id, e)
-                results["failed"].append({"story_id": story_id, "error": str(e)})
+        prepared = await asyncio.gather(*(prepare(a) for a in valid_articles), return_exceptions=True)
+        for article_data, action in zip(valid_articles, prepared):
+            if isinstance(action, Exception):
+                logger.error("Failed to prepare article %s: %s", article_data["story_id"], action)
+                results["failed"].append({"story_id": article_data["story_id"], "error": str(action)})
+            else:
+                actions.append(action)
 
         if not actions:
             return {"status": "error", "message": "No valid articles to index", "failed": results["failed"]}
 
         # Execute bulk indexing
+        from elasticsearch.helpers import async_bulk
         try:
-            success_count, errors = bulk(
+            success_count, errors = await async_bulk(
                 self.es_client,
                 actions,
-                refresh="wait_for",
+                chunk_size=ES_BULK_CHUNK_SIZE,
+                max_chunk_bytes=ES_BULK_MAX_CHUNK_BYTES,
+                refresh=False,
                 raise_on_error=False
             )
 
@@ -412,12 +713,12 @@ class PublisherAgent(BaseAgent):
             for action in actions:
                 story_id = action["_id"]
                 results["succeeded"].append(story_id)
-                self.published_articles[story_id] = {
+                self._record_publication(story_id, {
                     "story_id": story_id,
                     "headline": action["_source"].get("headline"),
                     "published_at": action["_source"].get("published_at"),
                     "elasticsearch_indexed": True
-                }
+                })
 
             if errors:
                 for error in errors:
@@ -433,16 +734,28 @@ class PublisherAgent(BaseAgent):
             }
 
         except Exception as e:
-            logger.error("Bulk indexing failed: %s", e, exc_info=True)
+            logger.error("Bulk indexing failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"status": "error", "message": f"Bulk indexing failed: {str(e)}"}
 
     async def _generate_tags_and_categories(self, article_data: Dict[str, Any]) -> tuple[List[str], List[str]]:
         """Generate tags and categories from article content using MCP generate_tags tool"""
 
         headline = article_data.get("headline", "")
-        content = article_data.get("content", "")
+        # Only the first 500 characters of the article feed tag generation;
+        # slice once for both the cache key and the tool call
+        preview = (article_data.get("content") or "")[:500]
         topic = article_data.get("topic", "")
 
+        # Republished or re-edited articles with unchanged tag inputs skip the MCP/LLM call
+        cache_key = hashlib.blake2b(
+            f"{headline}\0{topic}\0{preview}".encode(), digest_size=16
+        ).hexdigest()
+        cached = self._tag_cache.get(cache_key)
+        if cached is not None:
+            self._tag_cache.move_to_end(cache_key)
+            logger.debug("Tag cache hit")
+            return list(cached[0]), list(cached[1])
+
         try:
             logger.debug("Calling MCP generate_tags tool")
 
@@ -454,84 +767,99 @@ class PublisherAgent(BaseAgent):
                 tool_name="generate_tags",
                 arguments={
                     "headline": headline,
-                    "content": content[:500],  # First 500 chars
+                    "content": preview,
                     "topic": topic
                 }
             )
 
             # Parse the JSON response
-            tag_data = json.loads(result) if isinstance(result, str) else result
+            tag_data = _parse_mcp_result(result)
             tags = tag_data.get("tags", [])
             categories = tag_data.get("categories", [])
 
             logger.debug("Tags generated count=%s categories=%s", len(tags), len(categories))
+
+            self._tag_cache[cache_key] = (tuple(tags), tuple(categories))
+            if len(self._tag_cache) > TAG_CACHE_MAX_ENTRIES:
+                self._tag_cache.popitem(last=False)
             return tags, categories
 
         except Exception as e:
-            logger.error("MCP generate_tags tool failed: %s", e, exc_info=True)
+            logger.error("MCP generate_tags tool failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             # MCP server is required - re-raise the exception
             raise Exception(f"MCP generate_tags tool failed: {e}")
 
-    async def _deploy_to_production(self, story_id: str, article_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deploy article to production via MCP deploy_to_production tool"""
-        try:
-            logger.info("Deploying to production via CI/CD pipeline")
+    async def _deploy_and_notify(self, story_id: str, article_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Deploy article to production and notify subscribers via the MCP
+        deploy_to_production and notify_subscribers tools.
 
-            # Direct call to MCP tool
+        Both calls go out concurrently over one MCP session. Each result is
+        handled on its own, so one failing step never discards the other.
+
+        Returns:
+            Tuple of (deployment_data, notification_data)
+        """
+        try:
+            # Direct calls to MCP tools
             if self.mcp_client is None:
                 self._init_mcp_client()
 
             url_slug = article_data.get('url_slug', story_id)
-            build_number = f"#{int(time.time()) % 10000}"
+            build_number = f"#{next(self._build_counter) % 10000:04d}"
+            headline = article_data.get('headline', article_data.get('topic', 'Untitled'))
+            topic = article_data.get('topic', 'General')
 
-            result = await self.mcp_client.call_tool(
-                tool_name="deploy_to_production",
-                arguments={
+            deploy_result, notify_result = await self.mcp_client.call_tools([
+                ("deploy_to_production", {
                     "story_id": story_id,
                     "url_slug": url_slug,
                     "build_number": build_number
-                }
-            )
+                }),
+                ("notify_subscribers", {
+                    "story_id": story_id,
+                    "headline": headline,
+                    "topic": topic
+                })
+            ])
+        except Exception as e:
+            deploy_result = notify_result = e
+
+        return self._deployment_result(deploy_result), self._notification_result(notify_result)
+
+    def _deployment_result(self, result: Any) -> Dict[str, Any]:
+        """Parse and log a deploy_to_production result (an Exception if the call failed)"""
+        try:
+            if isinstance(result, Exception):
+                raise result
 
             # Parse the JSON response
-            deployment_data = json.loads(result) if isinstance(result, str) else result
+            deployment_data = _parse_mcp_result(result)
 
             # Log deployment results
             build_info = deployment_data.get("build", {})
             deploy_info = deployment_data.get("deployment", {})
 
-            logger.debug("Build %s completed duration=%ss", build_info.get('number'), build_info.get('duration_seconds'))
-            logger.debug("Deployment to %s completed url=%s", deploy_info.get('environment'), deploy_info.get('url'))
+            logger.debug(
+                "Build %s completed duration=%ss; deployed to %s url=%s",
+                build_info.get('number'), build_info.get('duration_seconds'),
+                deploy_info.get('environment'), deploy_info.get('url')
+            )
 
             return deployment_data
 
         except Exception as e:
-            logger.error("Deployment failed: %s", e, exc_info=True)
+            logger.error("Deployment failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"status": "error", "message": str(e)}
 
-    async def _notify_subscribers(self, story_id: str, article_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Notify subscribers via MCP notify_subscribers tool"""
+    def _notification_result(self, result: Any) -> Dict[str, Any]:
+        """Parse and log a notify_subscribers result (an Exception if the call failed)"""
         try:
-            logger.info("Notifying subscribers via CRM")
-
-            # Direct call to MCP tool
-            if self.mcp_client is None:
-                self._init_mcp_client()
-
-            headline = article_data.get('headline', article_data.get('topic', 'Untitled'))
-            topic = article_data.get('topic', 'General')
-
-            result = await self.mcp_client.call_tool(
-                tool_name="notify_subscribers",
-                arguments={
-                    "story_id": story_id,
-                    "headline": headline,
-                    "topic": topic
-                }
-            )
+            if isinstance(result, Exception):
+                raise result
 
             # Parse the JSON response
-            notification_data = json.loads(result) if isinstance(result, str) else result
+            notification_data = _parse_mcp_result(result)
 
             # Log notification results
             notif_info = notification_data.get("notification", {})
@@ -542,25 +870,22 @@ class PublisherAgent(BaseAgent):
             return notification_data
 
         except Exception as e:
-            logger.error("Subscriber notification failed: %s", e, exc_info=True)
+            logger.error("Subscriber notification failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {"status": "error", "message": str(e)}
 
-    async def _save_article_to_file(self, article_data: Dict[str, Any], tags: List[str], categories: List[str]) -> str:
-        """Save article to local markdown file"""
+    async def _save_article_to_file(self, article_data: Dict[str, Any], tags: List[str], categories: List[str], now: Optional[datetime] = None) -> str:
+        """Save article to local markdown file (stamped with now, defaulting to the current time)"""
         story_id = article_data.get("story_id")
         topic = article_data.get("topic", "article")
         content = article_data.get("content", "")
         headline = article_data.get("headline", "Untitled")
         research_sources = article_data.get("research_sources", [])
 
-        # Create articles directory if it doesn't exist
-        articles_dir = "articles"
-        os.makedirs(articles_dir, exist_ok=True)
-
-        # Generate filename from topic and story_id
-        filename = topic.lower().replace(" ", "-").replace(":", "").replace(",", "")
-        filename = "".join(c for c in filename if c.isalnum() or c in ('-', '_'))
-        filepath = os.path.join(articles_dir, f"{filename}-{story_id}.md")
+        # Generate filename from topic and story_id (just the story_id when the
+        # topic has no usable characters, e.g. only punctuation or emoji)
+        slug = _SLUG_RE.sub('-', topic.lower()).strip('-')
+        filename = f"{slug}-{story_id}.md" if slug else f"{story_id}.md"
+        filepath = os.path.join(self.articles_dir, filename)
 
         # Build research sources section grouped by domain
         # Always replace any existing Sources section from the LLM with a properly
@@ -568,16 +893,9 @@ class PublisherAgent(BaseAgent):
         sources_section = ""
         if research_sources:
             # Strip any existing Sources section from content so we can replace it
-            import re
-            content = re.sub(
-                r'\n##\s+Sources\s*\n.*',
-                '',
-                content,
-                flags=re.DOTALL | re.IGNORECASE
-            ).rstrip()
+            content = _SOURCES_SECTION_RE.sub('', content).rstrip()
 
             # Group sources by domain
-            from urllib.parse import urlparse
             domain_groups = {}
             for src in research_sources:
                 url = src.get("url", "")
@@ -597,83 +915,67 @@ class PublisherAgent(BaseAgent):
                         sources_section += f"- [{src['title']}]({src['url']})\n"
                     sources_section += "\n"
 
-        # Build markdown content with metadata
-        markdown_content = f"""---
-title: {topic}
-story_id: {story_id}
-headline: {headline}
-author: Elastic News Reporter Agent
-date: {datetime.now().strftime('%Y-%m-%d')}
-word_count: {article_data.get('word_count')}
-tags: {', '.join(tags)}
-categories: {', '.join(categories)}
----
-
-{content}
-{sources_section}
----
-
-**Article Metadata:**
-- Story ID: {story_id}
-- Published: {datetime.now().isoformat()}
-- Word Count: {article_data.get('word_count')}
-- Tags: {', '.join(tags)}
-- Categories: {', '.join(categories)}
-
-*Generated by Elastic News - A Multi-Agent AI Newsroom*
-*Powered by Anthropic Claude Sonnet 4 and A2A Protocol*
-"""
+        # Build markdown metadata (timestamp and joined lists computed once)
+        now = now or datetime.now(timezone.utc)
+        word_count = article_data.get('word_count')
+        tags_str = ", ".join(tags)
+        categories_str = ", ".join(categories)
+        frontmatter = _ARTICLE_FRONTMATTER_TEMPLATE.format(
+            topic=topic,
+            story_id=story_id,
+            headline=headline,
+            date=now.strftime('%Y-%m-%d'),
+            word_count=word_count,
+            tags=tags_str,
+            categories=categories_str
+        )
+        footer = _ARTICLE_FOOTER_TEMPLATE.format(
+            story_id=story_id,
+            published=now.isoformat(),
+            word_count=word_count,
+            tags=tags_str,
+            categories=categories_str
+        )
 
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # Write the segments in one call without blocking the event loop;
+        # the article body is never copied into a combined string
+        async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
+            await f.writelines((frontmatter, content, "\n", sources_section, footer))
 
         return filepath
 
-    def _build_es_document(self, article_data: Dict[str, Any], tags: List[str], categories: List[str]) -> Dict[str, Any]:
-        """Build Elasticsearch document from article data"""
+    def _build_es_document(self, article_data: Dict[str, Any], tags: List[str], categories: List[str], now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """Build Elasticsearch document from article data (stamped with now_iso, defaulting to the current time)"""
 
         # Calculate workflow duration if timestamps available
         workflow_duration_ms = None
-        if article_data.get("created_at") and article_data.get("published_at"):
+        created_at = article_data.get("created_at")
+        published_at = article_data.get("published_at")
+        if created_at and published_at:
             try:
-                created = datetime.fromisoformat(article_data["created_at"].replace("Z", "+00:00"))
-                published = datetime.fromisoformat(article_data["published_at"].replace("Z", "+00:00"))
+                # fromisoformat accepts a trailing "Z" natively on Python 3.11+
+                created = datetime.fromisoformat(created_at)
+                published = datetime.fromisoformat(published_at)
                 workflow_duration_ms = int((published - created).total_seconds() * 1000)
             except Exception as e:
                 logger.warning("Could not calculate workflow duration: %s", e)
 
         # Build document
-        document = {
-            "story_id": article_data.get("story_id"),
-            "headline": article_data.get("headline"),
-            "content": article_data.get("content"),
-            "topic": article_data.get("topic"),
-            "angle": article_data.get("angle"),
-            "word_count": article_data.get("word_count"),
-            "target_length": article_data.get("target_length"),
-            "priority": article_data.get("priority", "normal"),
-            "status": "published",
-            "published_at": article_data.get("published_at") or datetime.now().isoformat(),
-            "created_at": article_data.get("created_at"),
-            "updated_at": datetime.now().isoformat(),
-            "author": article_data.get("author", "Reporter Agent"),
-            "editor": article_data.get("editor", "Editor Agent"),
-            "tags": tags,
-            "categories": categories,
-            "research_questions": article_data.get("research_questions", []),
-            "research_data": self._sanitize_research_data(article_data.get("research_data", [])),
-            "editorial_review": article_data.get("editorial_review"),
-            "archive_references": article_data.get("archive_references"),
-            "research_sources": article_data.get("research_sources", []),
-            "url_slug": article_data.get("url_slug"),
-            "filepath": article_data.get("filepath"),
-            "version": article_data.get("version", 1),
-            "revisions_count": article_data.get("revisions_count", 0),
-            "agents_involved": article_data.get("agents_involved", ["News Chief", "Reporter", "Researcher", "Archivist", "Editor", "Publisher"]),
-            "workflow_duration_ms": workflow_duration_ms,
-            "metadata": article_data.get("metadata", {})
-        }
+        now = now_iso or datetime.now(timezone.utc).isoformat()
+        document = {field: article_data.get(field, default) for field, default in _ES_COPIED_FIELDS}
+        document.update(
+            status="published",
+            published_at=published_at or now,
+            updated_at=now,
+            tags=tags,
+            categories=categories,
+            research_questions=article_data.get("research_questions", []),
+            research_data=self._sanitize_research_data(article_data.get("research_data", [])),
+            research_sources=article_data.get("research_sources", []),
+            agents_involved=article_data["agents_involved"] if "agents_involved" in article_data else list(_DEFAULT_AGENTS_INVOLVED),
+            workflow_duration_ms=workflow_duration_ms,
+            metadata=article_data.get("metadata", {})
+        )
 
         return document
 
@@ -695,7 +997,8 @@ categories: {', '.join(categories)}
             return {
                 "status": "success",
                 "total_published": len(self.published_articles),
-                "recent_publications": list(self.published_articles.values())[-10:]  # Last 10
+                # Last 10, oldest first, without copying every record
+                "recent_publications": list(itertools.islice(reversed(self.published_articles.values()), 10))[::-1]
             }
 
 
@@ -723,7 +1026,7 @@ class PublisherAgentExecutor(AgentExecutor):
 
         # Send result as A2A message
         await event_queue.enqueue_event(
-            new_agent_text_message(json.dumps(result, indent=2))
+            new_agent_text_message(encode_json(result))
         )
 
     async def cancel(self, context, event_queue) -> None:
@@ -732,8 +1035,9 @@ class PublisherAgentExecutor(AgentExecutor):
 
 
 # Agent Card definition
+@functools.lru_cache(maxsize=8)
 def create_agent_card(host: str, port: int) -> AgentCard:
-    """Create the Publisher agent card"""
+    """Create the Publisher agent card (memoized per host/port; treat as read-only)"""
     return AgentCard(
         name="Publisher",
         description="Publishes finalized articles to Elasticsearch, handles CI/CD deployment, and sends CRM notifications. Works through News Chief for workflow coordination.",
@@ -799,8 +1103,25 @@ def create_agent_card(host: str, port: int) -> AgentCard:
     )
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Run the bulk indexer; close ES connections on shutdown"""
+    agent = get_publisher_agent()
+    agent.start_indexer()
+    try:
+        yield
+    finally:
+        await agent.aclose()
+
+
 def create_app(host='localhost', port=8084):
-    """Factory function to create the A2A application"""
+    """Factory function to create the A2A application (built once per host/port)"""
+    return _build_app(host, port)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_app(host: str, port: int):
+    """Build the A2A application for create_app"""
     agent_card = create_agent_card(host, port)
 
     request_handler = DefaultRequestHandler(
@@ -813,7 +1134,7 @@ def create_app(host='localhost', port=8084):
         http_handler=request_handler
     )
 
-    app = server.build()
+    app = server.build(lifespan=lifespan)
     
     # Add CORS middleware for React UI
     app.add_middleware(
@@ -827,8 +1148,11 @@ def create_app(host='localhost', port=8084):
     return app
 
 
-# Create default app instance for uvicorn
-app = create_app()
+def __getattr__(name):
+    """Build the default app for uvicorn (agents.publisher:app) on first access, not at import"""
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @click.command()
@@ -5,11 +5,14 @@ Writes news articles based on story assignments from the News Chief.
 Uses Anthropic Claude for AI-powered content generation.
 """
 
-import json
+import hashlib
 import os
+import re
 import time
 import asyncio
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 import click
@@ -22,7 +25,7 @@ from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities
 from a2a.utils import new_agent_text_message
 from a2a.client import create_text_message_object
-from utils import setup_logger, load_env_config, run_agent_server, format_json_for_log, truncate_text
+from utils import setup_logger, load_env_config, run_agent_server, format_json_for_log, truncate_text, encode_json, encode_json_bytes, decode_json, JSONDecodeError
 from agents.base_agent import BaseAgent
 from agents.archivist_client import converse, send_task
 
@@ -32,9 +35,67 @@ load_env_config()
 # Configure logging using centralized utility
 logger = setup_logger("REPORTER")
 
+# Outlines are reused for recent assignments with the same target length and
+# angle whose topic wording is a near duplicate (see _lookup_outline)
+OUTLINE_CACHE_MAX_ENTRIES = int(os.getenv("REPORTER_OUTLINE_CACHE_SIZE", "500"))
+OUTLINE_CACHE_TTL_SECONDS = int(os.getenv("REPORTER_OUTLINE_CACHE_TTL_SECONDS", "3600"))
+# Minimum Jaccard similarity (0-1) of two topics' content words for an outline
+# to be reused. At 1.0 only rewordings of the same words (order, case,
+# stopwords) share an outline; lower values let more distinct stories share one.
+OUTLINE_CACHE_MIN_SIMILARITY = float(os.getenv("REPORTER_OUTLINE_CACHE_SIMILARITY", "0.8"))
+
+# Successful Researcher/Archivist replies are reused for exact repeats of the
+# same request (research: topic + questions; archive: topic + angle)
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("REPORTER_RESULT_CACHE_SIZE", "256"))
+RESULT_CACHE_TTL_SECONDS = int(os.getenv("REPORTER_RESULT_CACHE_TTL_SECONDS", "900"))
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+# A level-1 or level-2 markdown heading line, and the marker to strip from it
+_HEADING_RE = re.compile(r'^#{1,2}\s+.+')
+_HEADING_MARKER_RE = re.compile(r'^#+\s+')
+_OUTLINE_STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "how", "in", "is",
+    "its", "of", "on", "or", "the", "to", "what", "why", "with",
+))
+
+
+def _outline_terms(topic: str) -> FrozenSet[str]:
+    """Content words of an assignment's topic, for near-duplicate outline lookup"""
+    return frozenset(
+        word for word in _WORD_RE.findall(topic.lower())
+        if word not in _OUTLINE_STOPWORDS
+    )
+
+
 # Singleton instance for maintaining state across requests
 _reporter_agent_instance = None
 
+def _extract_headline(content: str) -> str:
+    """
+    Pick an article's headline in priority order: a "HEADLINE: ..." line, the
+    first # or ## heading, then the first non-empty line.
+
+    Walks the lines once and stops as soon as the answer is known; drafts
+    without a HEADLINE: line stop at their first heading.
+    """
+    has_prefix = "HEADLINE:" in content
+    first_heading = None
+    first_line = None
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if has_prefix and line.startswith('HEADLINE:'):
+            return line.replace('HEADLINE:', '').strip()
+        if first_line is None:
+            first_line = line
+        if first_heading is None and _HEADING_RE.match(line):
+            first_heading = _HEADING_MARKER_RE.sub('', line)
+            if not has_prefix:
+                return first_heading
+    return first_heading or first_line or "Untitled Article"
+
+
 class ReporterAgent(BaseAgent):
     """Reporter Agent - Writes news articles based on assignments"""
 
@@ -49,6 +110,12 @@ class ReporterAgent(BaseAgent):
         self.archive_data: Dict[str, Dict[str, Any]] = {}
         self.archivist_status: Dict[str, str] = {}  # Track Archivist activity per story
         self.waiting_status: Dict[str, str] = {}  # Track what agent is waiting for
+        # (target_length, normalized angle, topic terms) -> (monotonic store time, outline data);
+        # oldest first, see _lookup_outline
+        self._outline_cache: OrderedDict[Tuple[int, str, FrozenSet[str]], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # Request digest -> (monotonic store time, reply); see _get_cached_result
+        self._research_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._archive_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
         self.editor_url = editor_url or "http://localhost:8082"
         self.researcher_url = researcher_url or "http://localhost:8083"
         self.publisher_url = publisher_url or "http://localhost:8084"
@@ -59,6 +126,13 @@ class ReporterAgent(BaseAgent):
         self.archivist_card_url = archivist_url or os.getenv("ELASTIC_ARCHIVIST_AGENT_CARD_URL")  # Agent card URL (fallback)
         self.archivist_api_key = os.getenv("ELASTIC_ARCHIVIST_API_KEY")
 
+        # Long-lived pooled HTTP client shared by every A2A hop (Researcher,
+        # Archivist, News Chief, Publisher); keeps connections alive between calls
+        self._http_client = httpx.AsyncClient(
+            timeout=300.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100)
+        )
+
         # Initialize Anthropic client using centralized utility (from BaseAgent)
         self._init_anthropic_client()
         if not self.anthropic_client:
@@ -68,8 +142,12 @@ class ReporterAgent(BaseAgent):
         self._init_mcp_client()
 
     # Note: Helper methods (_error_response, _success_response, _create_a2a_client,
-    # _parse_a2a_response, _strip_json_codeblocks, _call_anthropic) are now
-    # inherited from BaseAgent
+    # _forget_agent, _parse_a2a_response, _strip_json_codeblocks, _call_anthropic)
+    # are now inherited from BaseAgent
+
+    async def aclose(self):
+        """Close the pooled HTTP client (called on application shutdown)"""
+        await self._http_client.aclose()
 
     async def invoke(self, query: str) -> Dict[str, Any]:
         """
@@ -87,7 +165,7 @@ class ReporterAgent(BaseAgent):
                 logger.debug("Received query: %s", format_json_for_log(query))
 
             # Parse the query to determine the action
-            query_data = json.loads(query) if query.startswith('{') else {"action": "status"}
+            query_data = decode_json(query) if query.startswith('{') else {"action": "status"}
             action = query_data.get("action")
 
             # Only log non-status actions to reduce log spam
@@ -96,6 +174,8 @@ class ReporterAgent(BaseAgent):
 
             if action == "accept_assignment":
                 return await self._accept_assignment(query_data)
+            elif action == "accept_assignments":
+                return await self._accept_assignments(query_data)
             elif action == "write_article":
                 return await self._write_article(query_data)
             elif action == "apply_edits":
@@ -106,10 +186,10 @@ class ReporterAgent(BaseAgent):
                 return {
                     "status": "error",
                     "message": f"Unknown action: {action}",
-                    "available_actions": ["accept_assignment", "write_article", "apply_edits", "get_status"]
+                    "available_actions": ["accept_assignment", "accept_assignments", "write_article", "apply_edits", "get_status"]
                 }
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             return {
                 "status": "error",
                 "message": f"Invalid JSON in query: {str(e)}"
@@ -164,6 +244,25 @@ class ReporterAgent(BaseAgent):
             reporter_status="ready_to_write"
         )
 
+    async def _accept_assignments(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Accept a batch of story assignments from News Chief in one round trip"""
+        assignments = request.get("assignments", [])
+        if not assignments:
+            return self._error_response("No assignments provided")
+
+        logger.info("Processing batch of %s assignments from News Chief...", len(assignments))
+
+        # Results are returned in the same order as the submitted assignments
+        results = [
+            await self._accept_assignment({"assignment": assignment})
+            for assignment in assignments
+        ]
+
+        return self._success_response(
+            f"Processed {len(results)} assignments",
+            results=results
+        )
+
     async def _write_article(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Write an article using Anthropic Claude with Researcher support"""
         logger.info("Starting article writing...")
@@ -184,8 +283,19 @@ class ReporterAgent(BaseAgent):
 
         # Generate outline and research questions
         try:
+            # The Archivist search needs only topic and angle, so it runs while
+            # the outline is generated rather than after it
+            self.archivist_status[story_id] = "active"
+            archivist_task = asyncio.create_task(self._send_to_archivist(story_id, assignment))
+
             logger.info("Generating outline and identifying research needs...")
-            outline_and_questions = await self._generate_outline_and_questions(assignment)
+            try:
+                outline_and_questions = await self._generate_outline_and_questions(assignment)
+            except BaseException:
+                archivist_task.cancel()
+                await asyncio.gather(archivist_task, return_exceptions=True)
+                self.archivist_status.pop(story_id, None)
+                raise
             outline = outline_and_questions.get("outline", "")
             research_questions = outline_and_questions.get("research_questions", [])
 
@@ -212,21 +322,19 @@ class ReporterAgent(BaseAgent):
                     data={"question_count": len(research_questions)}
                 )
 
-                # Publish event: archive search started
+                # Publish event: archive search started (announced only once its
+                # result will be awaited; the search itself began with the outline)
                 await self._publish_event(
                     event_type="archive_search_started",
                     story_id=story_id,
                     data={"topic": assignment.get("topic")}
                 )
 
-                # Set waiting status and Archivist status to active
                 self.waiting_status[story_id] = "researcher_archivist"
-                self.archivist_status[story_id] = "active"
                 logger.debug("Reporter waiting for Researcher and Archivist: story=%s", story_id)
 
-                # Create tasks for parallel execution
+                # The Researcher starts now; the Archivist search is already running
                 researcher_task = self._send_to_researcher(story_id, assignment, research_questions)
-                archivist_task = self._send_to_archivist(story_id, assignment)
 
                 # Execute both in parallel
                 research_response, archive_response = await asyncio.gather(
@@ -302,6 +410,10 @@ class ReporterAgent(BaseAgent):
                     raise Exception(error_msg)
             else:
                 logger.debug("No research questions needed for this article")
+                # Archive context is only gathered alongside research
+                archivist_task.cancel()
+                await asyncio.gather(archivist_task, return_exceptions=True)
+                self.archivist_status.pop(story_id, None)
 
             # Clear waiting status and update to writing
             self.waiting_status[story_id] = "none"
@@ -314,20 +426,7 @@ class ReporterAgent(BaseAgent):
             logger.info("Article generated: words=%s", len(article_content.split()))
 
             # Extract headline from article content
-            lines = article_content.strip().split('\n')
-            import re as _re
-            # Priority 1: "HEADLINE: ..." prefix
-            headline_line = next((l.strip() for l in lines if l.strip().startswith('HEADLINE:')), None)
-            if headline_line:
-                headline = headline_line.replace('HEADLINE:', '').strip()
-            else:
-                # Priority 2: First markdown heading (# or ##)
-                heading_line = next((l.strip() for l in lines if _re.match(r'^#{1,2}\s+.+', l.strip())), None)
-                if heading_line:
-                    headline = _re.sub(r'^#+\s+', '', heading_line)
-                else:
-                    # Priority 3: First non-empty line
-                    headline = next((l.strip() for l in lines if l.strip()), "Untitled Article")
+            headline = _extract_headline(article_content)
 
             # Store draft
             draft = {
@@ -365,21 +464,6 @@ class ReporterAgent(BaseAgent):
             if news_chief_response.get("status") == "success":
                 logger.info("Draft submitted to News Chief successfully")
 
-                # Extract headline from article content
-                lines = article_content.strip().split('\n')
-                # Priority 1: "HEADLINE: ..." prefix
-                headline_line = next((l.strip() for l in lines if l.strip().startswith('HEADLINE:')), None)
-                if headline_line:
-                    headline = headline_line.replace('HEADLINE:', '').strip()
-                else:
-                    # Priority 2: First markdown heading (# or ##)
-                    heading_line = next((l.strip() for l in lines if _re.match(r'^#{1,2}\s+.+', l.strip())), None)
-                    if heading_line:
-                        headline = _re.sub(r'^#+\s+', '', heading_line)
-                    else:
-                        # Priority 3: First non-empty line
-                        headline = next((l.strip() for l in lines if l.strip()), "Untitled Article")
-
                 return {
                     "status": "success",
                     "message": "Article draft completed and submitted to News Chief",
@@ -415,6 +499,13 @@ class ReporterAgent(BaseAgent):
         angle = assignment.get("angle", "")
         target_length = assignment.get("target_length", 1000)
 
+        # The angle shapes the whole outline, so only the topic is matched fuzzily
+        cache_key = (target_length, " ".join(angle.lower().split()), _outline_terms(topic))
+        cached = self._lookup_outline(cache_key)
+        if cached is not None:
+            logger.debug("Outline cache hit: questions=%s", len(cached.get('research_questions', [])))
+            return cached
+
         try:
             logger.debug("Calling MCP generate_outline tool...")
 
@@ -432,8 +523,14 @@ class ReporterAgent(BaseAgent):
             )
 
             # Parse the JSON response
-            outline_data = json.loads(result) if isinstance(result, str) else result
+            outline_data = decode_json(result) if isinstance(result, (str, bytes)) else result
             logger.debug("Outline generated: questions=%s", len(outline_data.get('research_questions', [])))
+
+            if cache_key[2]:
+                self._outline_cache[cache_key] = (time.monotonic(), dict(outline_data))
+                self._outline_cache.move_to_end(cache_key)
+                if len(self._outline_cache) > OUTLINE_CACHE_MAX_ENTRIES:
+                    self._outline_cache.popitem(last=False)
             return outline_data
 
         except Exception as e:
@@ -441,37 +538,108 @@ class ReporterAgent(BaseAgent):
             # MCP server is REQUIRED - re-raise with clear message
             raise
 
+    def _lookup_outline(self, cache_key: Tuple[int, str, FrozenSet[str]]) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the closest cached outline for a near-duplicate assignment, or None.
+
+        Only entries with the same target length and angle are considered; the
+        topic may differ slightly (Jaccard overlap of its content words).
+        """
+        target_length, angle, terms = cache_key
+        if not terms:
+            return None
+
+        # Entries are kept in store order, so expired ones are at the front
+        now = time.monotonic()
+        while self._outline_cache:
+            oldest_key = next(iter(self._outline_cache))
+            if now - self._outline_cache[oldest_key][0] < OUTLINE_CACHE_TTL_SECONDS:
+                break
+            del self._outline_cache[oldest_key]
+
+        # Exact repeats (same words, any order or case) need no similarity scan
+        exact = self._outline_cache.get(cache_key)
+        if exact is not None:
+            return dict(exact[1])
+
+        best_key, best_similarity = None, OUTLINE_CACHE_MIN_SIMILARITY
+        for key in self._outline_cache:
+            cached_length, cached_angle, cached_terms = key
+            if cached_length != target_length or cached_angle != angle:
+                continue
+            similarity = len(terms & cached_terms) / len(terms | cached_terms)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is None:
+            return None
+        return dict(self._outline_cache[best_key][1])
+
+    @staticmethod
+    def _result_cache_key(*parts: Any) -> str:
+        """Digest of the request fields that determine a Researcher/Archivist reply"""
+        return hashlib.blake2b(encode_json_bytes(parts), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_cached_result(cache: OrderedDict, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached reply younger than RESULT_CACHE_TTL_SECONDS, or None"""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= RESULT_CACHE_TTL_SECONDS:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return dict(cached[1])
+
+    @staticmethod
+    def _store_result(cache: OrderedDict, key: str, result: Dict[str, Any]):
+        """Cache a successful reply, evicting the least recently used entry past RESULT_CACHE_MAX_ENTRIES"""
+        if result.get("status") != "success":
+            return
+        cache[key] = (time.monotonic(), dict(result))
+        cache.move_to_end(key)
+        if len(cache) > RESULT_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
     async def _send_to_researcher(self, story_id: str, assignment: Dict[str, Any], questions: List[str]) -> Dict[str, Any]:
         """Send research questions to Researcher agent via A2A"""
+        cache_key = self._result_cache_key(assignment.get("topic"), questions)
+        cached = self._get_cached_result(self._research_cache, cache_key)
+        if cached is not None:
+            logger.debug("Research cache hit: story=%s", story_id)
+            return cached
+
         try:
-            async with httpx.AsyncClient(timeout=300.0) as http_client:
-                # Create A2A client using helper
-                researcher_client, _ = await self._create_a2a_client(http_client, self.researcher_url, "Researcher")
+            # Create A2A client using helper
+            researcher_client, _ = await self._create_a2a_client(self._http_client, self.researcher_url, "Researcher")
 
-                # Send research_questions task to Researcher
-                request = {
-                    "action": "research_questions",
-                    "story_id": story_id,
-                    "topic": assignment.get("topic"),
-                    "questions": questions
-                }
-                logger.debug("Sending A2A message to Researcher: story=%s questions=%s", story_id, len(questions))
+            # Send research_questions task to Researcher
+            request = {
+                "action": "research_questions",
+                "story_id": story_id,
+                "topic": assignment.get("topic"),
+                "questions": questions
+            }
+            logger.debug("Sending A2A message to Researcher: story=%s questions=%s", story_id, len(questions))
 
-                message = create_text_message_object(content=json.dumps(request))
+            message = create_text_message_object(content=encode_json(request))
 
-                # Get response using helper
-                logger.debug("Waiting for Researcher response...")
-                result = await self._parse_a2a_response(researcher_client, message)
+            # Get response using helper
+            logger.debug("Waiting for Researcher response...")
+            result = await self._parse_a2a_response(researcher_client, message)
 
-                if result:
-                    logger.debug("Received A2A response from Researcher: status=%s research_id=%s answered=%s", result.get('status'), result.get('research_id'), result.get('total_questions'))
-                    return result
+            if result:
+                logger.debug("Received A2A response from Researcher: status=%s research_id=%s answered=%s", result.get('status'), result.get('research_id'), result.get('total_questions'))
+                self._store_result(self._research_cache, cache_key, result)
+                return result
 
-                logger.warning("No response from Researcher")
-                return {"status": "error", "message": "No response from Researcher"}
+            logger.warning("No response from Researcher")
+            return {"status": "error", "message": "No response from Researcher"}
 
         except Exception as e:
             logger.error("Failed to send research request to Researcher: %s", e, exc_info=True)
+            self._forget_agent(self.researcher_url)
             return self._error_response(f"Failed to contact Researcher: {str(e)}")
 
     async def _send_to_archivist(self, story_id: str, assignment: Dict[str, Any]) -> Dict[str, Any]:
@@ -505,6 +673,12 @@ class ReporterAgent(BaseAgent):
         angle = assignment.get("angle", "")
         search_query = f"Find articles about {topic} {angle}".strip()
 
+        cache_key = self._result_cache_key(topic, angle)
+        cached = self._get_cached_result(self._archive_cache, cache_key)
+        if cached is not None:
+            logger.debug("Archive cache hit: story=%s", story_id)
+            return cached
+
         archivist_source = "ELASTIC_ARCHIVIST_AGENT_URL" if self.archivist_agent_url else "ELASTIC_ARCHIVIST_AGENT_CARD_URL"
         logger.debug("Calling Archivist via archivist_client module: query=%s, url_source=%s", search_query, archivist_source)
 
@@ -518,8 +692,10 @@ class ReporterAgent(BaseAgent):
                 agent_url=self.archivist_agent_url,
                 card_url=self.archivist_card_url,
                 api_key=self.archivist_api_key,
-                max_retries=10
+                max_retries=10,
+                http_client=self._http_client
             )
+            self._store_result(self._archive_cache, cache_key, result)
             return result
         except Exception as e:
             logger.error("Archivist call failed: %s", e)
@@ -532,7 +708,7 @@ class ReporterAgent(BaseAgent):
         target_length = assignment.get("target_length", 1000)
 
         # Convert research results to string for MCP tool
-        research_data = json.dumps(research_results) if research_results else ""
+        research_data = encode_json(research_results) if research_results else ""
 
         # Convert archive results to string for MCP tool
         archive_context = ""
@@ -597,34 +773,34 @@ class ReporterAgent(BaseAgent):
 
     async def _submit_draft_to_news_chief(self, story_id: str, draft: Dict[str, Any]) -> Dict[str, Any]:
         """Submit draft to News Chief for workflow management"""
+        news_chief_url = "http://localhost:8080"
         try:
-            async with httpx.AsyncClient(timeout=300.0) as http_client:
-                # Create A2A client using helper
-                news_chief_url = "http://localhost:8080"
-                news_chief_client, _ = await self._create_a2a_client(http_client, news_chief_url, "News Chief")
-
-                # Send draft submission request
-                submit_request = {
-                    "action": "submit_draft",
-                    "story_id": story_id,
-                    "draft": draft
-                }
-                logger.debug("Sending draft submission to News Chief: story=%s words=%s assignments=%s", story_id, draft.get('word_count'), list(self.assignments.keys()))
+            # Create A2A client using helper
+            news_chief_client, _ = await self._create_a2a_client(self._http_client, news_chief_url, "News Chief")
 
-                message = create_text_message_object(content=json.dumps(submit_request))
+            # Send draft submission request
+            submit_request = {
+                "action": "submit_draft",
+                "story_id": story_id,
+                "draft": draft
+            }
+            logger.debug("Sending draft submission to News Chief: story=%s words=%s assignments=%s", story_id, draft.get('word_count'), list(self.assignments.keys()))
 
-                # Get response using helper
-                logger.debug("Waiting for News Chief response...")
-                result = await self._parse_a2a_response(news_chief_client, message)
+            message = create_text_message_object(content=encode_json(submit_request))
 
-                if result:
-                    logger.debug("Received response from News Chief: status=%s message=%s", result.get('status'), result.get('message'))
-                    return result
+            # Get response using helper
+            logger.debug("Waiting for News Chief response...")
+            result = await self._parse_a2a_response(news_chief_client, message)
 
-                return self._error_response("No response from News Chief")
+            if result:
+                logger.debug("Received response from News Chief: status=%s message=%s", result.get('status'), result.get('message'))
+                return result
+
+            return self._error_response("No response from News Chief")
 
         except Exception as e:
             logger.error("Failed to submit draft to News Chief: %s", e, exc_info=True)
+            self._forget_agent(news_chief_url)
             return self._error_response(f"Failed to contact News Chief: {str(e)}")
 
     async def _apply_edits(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -738,33 +914,33 @@ class ReporterAgent(BaseAgent):
                 "agents_involved": ["News Chief", "Reporter", "Researcher", "Archivist", "Editor", "Publisher"]
             }
 
-            async with httpx.AsyncClient(timeout=120.0) as http_client:
-                # Create A2A client for Publisher
-                publisher_client, _ = await self._create_a2a_client(
-                    http_client,
-                    self.publisher_url,
-                    "Publisher"
-                )
+            # Create A2A client for Publisher
+            publisher_client, _ = await self._create_a2a_client(
+                self._http_client,
+                self.publisher_url,
+                "Publisher"
+            )
 
-                # Send publish request
-                request = {
-                    "action": "publish_article",
-                    "article": article_data
-                }
+            # Send publish request
+            request = {
+                "action": "publish_article",
+                "article": article_data
+            }
 
-                message = create_text_message_object(content=json.dumps(request))
-                logger.debug("Sending article to Publisher...")
+            message = create_text_message_object(content=encode_json(request))
+            logger.debug("Sending article to Publisher...")
 
-                result = await self._parse_a2a_response(publisher_client, message)
+            result = await self._parse_a2a_response(publisher_client, message)
 
-                if result:
-                    logger.debug("Publisher response received: status=%s", result.get('status'))
-                    return result
+            if result:
+                logger.debug("Publisher response received: status=%s", result.get('status'))
+                return result
 
-                return self._error_response("No response from Publisher")
+            return self._error_response("No response from Publisher")
 
         except Exception as e:
             logger.error("Failed to send to Publisher: %s", e, exc_info=True)
+            self._forget_agent(self.publisher_url)
             return self._error_response(f"Failed to contact Publisher: {str(e)}")
 
     async def _integrate_edits(self, original_content: str, review: Dict[str, Any]) -> str:
@@ -782,7 +958,7 @@ class ReporterAgent(BaseAgent):
                 tool_name="apply_edits",
                 arguments={
                     "original_content": original_content,
-                    "suggested_edits": json.dumps(suggested_edits)
+                    "suggested_edits": encode_json(suggested_edits)
                 }
             )
 
@@ -868,7 +1044,7 @@ class ReporterAgentExecutor(AgentExecutor):
 
         # Send result as A2A message
         await event_queue.enqueue_event(
-            new_agent_text_message(json.dumps(result, indent=2))
+            new_agent_text_message(encode_json(result))
         )
 
     async def cancel(self, context, event_queue) -> None:
@@ -904,6 +1080,15 @@ def create_agent_card(host: str, port: int) -> AgentCard:
                     "Accept assignment for climate change story"
                 ]
             ),
+            AgentSkill(
+                id="article.writing.accept_assignments",
+                name="Accept Story Assignments (Batch)",
+                description="Accepts several story assignments from the News Chief in a single request; results are returned in submission order",
+                tags=["writing", "assignment", "batch"],
+                examples=[
+                    '{"action": "accept_assignments", "assignments": [{"story_id": "story_123", "topic": "AI in Journalism"}, {"story_id": "story_124", "topic": "Climate Tech"}]}'
+                ]
+            ),
             AgentSkill(
                 id="article.writing.write_article",
                 name="Write Article",
@@ -944,6 +1129,16 @@ def create_agent_card(host: str, port: int) -> AgentCard:
     )
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Release pooled HTTP connections on shutdown"""
+    agent = get_reporter_agent()
+    try:
+        yield
+    finally:
+        await agent.aclose()
+
+
 def create_app(host='localhost', port=8081):
     """Factory function to create the A2A application"""
     # Create agent card using the single source of truth
@@ -961,7 +1156,7 @@ def create_app(host='localhost', port=8081):
         http_handler=request_handler
     )
 
-    app = server.build()
+    app = server.build(lifespan=lifespan)
 
     # Add CORS middleware for React UI
     app.add_middleware(
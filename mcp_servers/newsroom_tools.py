@@ -24,9 +24,11 @@ from anthropic import Anthropic
 from tavily import TavilyClient
 
 # Load environment variables
-from utils import load_env_config
+from utils import load_env_config, setup_logger, strip_json_codeblocks
 load_env_config()
 
+logger = setup_logger("MCP_SERVER")
+
 from utils.config import DEFAULT_MODEL
 
 # Initialize Anthropic client
@@ -50,6 +52,63 @@ else:
 # Initialize FastMCP server
 mcp = FastMCP("Newsroom Tools")
 
+# Forced tool call for generate_outline: Claude returns the outline as
+# already-structured tool input, so there is no fenced JSON text to parse
+_OUTLINE_TOOL = {
+    "name": "emit_outline",
+    "description": "Record the article outline and research questions.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "outline": {
+                "type": "string",
+                "description": "Comma-separated article sections"
+            },
+            "research_questions": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "3-5 specific research questions"
+            }
+        },
+        "required": ["outline", "research_questions"]
+    }
+}
+
+# Static system prompts for the outline and article calls. They are kept
+# byte-identical across calls and marked as Anthropic prompt-cache breakpoints;
+# the per-story details go in the user message after them. Prefixes shorter
+# than the model's minimum cacheable length are simply not cached.
+_OUTLINE_SYSTEM = [{
+    "type": "text",
+    "text": """You are a news editor. For each story you receive, create an article outline and identify 3-5 research questions.
+
+Provide:
+1. A clear article outline (comma-separated sections)
+2. 3-5 specific research questions that would strengthen the article with data and facts
+
+Record them with the emit_outline tool.""",
+    "cache_control": {"type": "ephemeral"}
+}]
+
+_ARTICLE_SYSTEM = [{
+    "type": "text",
+    "text": """You are a professional journalist. Write a news article based on the information you receive.
+
+Instructions:
+- Write in professional journalistic style
+- Include a compelling HEADLINE at the start
+- Use facts and figures from the research data
+- When citing a fact, statistic, or quote from the research data, mention the source name inline (e.g., "according to Forbes", "Reuters reported")
+- At the end of the article, include a "## Sources" section listing every source URL used
+- Group sources by their domain/publication (e.g., "**NYTimes.com**", "**Reuters.com**", "**NPR.org**"), then list each article as a bullet under its group: `- [Article Title](URL)`
+- Include ALL source URLs from the research data — do not omit any
+- Meet the target length (within 10%) — the Sources section does not count toward the word count
+- Make it engaging and informative
+
+Return ONLY the article text (headline + body + sources section), no JSON.""",
+    "cache_control": {"type": "ephemeral"}
+}]
+
 
 @mcp.tool()
 def research_questions(questions: List[str], topic: str) -> str:
@@ -140,9 +199,7 @@ Return ONLY a JSON object with this structure:
 
                 content = response.content[0].text
                 if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
+                    content = strip_json_codeblocks(content)
                 content = content.strip()
 
                 result = json.loads(content)
@@ -206,40 +263,29 @@ def generate_outline(topic: str, angle: str, target_length: int) -> str:
 
     angle_text = f"\nAngle/Focus: {angle}" if angle else ""
 
-    prompt = f"""You are a news editor. Create an article outline and identify 3-5 research questions for this story:
-
-Topic: {topic}{angle_text}
-Target Length: {target_length} words
-
-Provide:
-1. A clear article outline (comma-separated sections)
-2. 3-5 specific research questions that would strengthen the article with data and facts
-
-Return ONLY a JSON object:
-{{
-  "outline": "Introduction, Section 1, Section 2, ...",
-  "research_questions": ["Question 1?", "Question 2?", ...]
-}}"""
+    prompt = f"""Topic: {topic}{angle_text}
+Target Length: {target_length} words"""
 
     try:
         response = anthropic_client.messages.create(
             model=DEFAULT_MODEL,
             max_tokens=1000,
+            system=_OUTLINE_SYSTEM,
+            tools=[_OUTLINE_TOOL],
+            tool_choice={"type": "tool", "name": _OUTLINE_TOOL["name"]},
             messages=[{"role": "user", "content": prompt}]
         )
 
-        content = response.content[0].text.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-
-        outline_data = json.loads(content)
+        outline_data = next(
+            (block.input for block in response.content if getattr(block, "type", None) == "tool_use"),
+            None
+        )
+        if outline_data is None:
+            raise ValueError(f"no {_OUTLINE_TOOL['name']} tool call in response (stop_reason={getattr(response, 'stop_reason', None)})")
         return json.dumps(outline_data, indent=2)
 
     except Exception as e:
-        print("Error generating outline: %s" % e)
+        logger.error("Error generating outline, using fallback outline: %s", e, exc_info=True)
         return json.dumps({
             "outline": f"Introduction to {topic}, Analysis, Conclusion",
             "research_questions": [f"What are the key facts about {topic}?"]
@@ -274,9 +320,7 @@ Target: {target_length} words"""
     angle_text = f"\nAngle/Focus: {angle}" if angle else ""
     archive_text = f"\n\nARCHIVE CONTEXT (for background/reference):\n{archive_context}" if archive_context else ""
 
-    prompt = f"""You are a professional journalist. Write a news article based on the following information:
-
-TOPIC: {topic}{angle_text}
+    prompt = f"""TOPIC: {topic}{angle_text}
 
 OUTLINE:
 {outline}
@@ -284,25 +328,13 @@ OUTLINE:
 RESEARCH DATA:
 {research_data}{archive_text}
 
-TARGET LENGTH: {target_length} words
-
-Instructions:
-- Write in professional journalistic style
-- Include a compelling HEADLINE at the start
-- Use facts and figures from the research data
-- When citing a fact, statistic, or quote from the research data, mention the source name inline (e.g., "according to Forbes", "Reuters reported")
-- At the end of the article, include a "## Sources" section listing every source URL used
-- Group sources by their domain/publication (e.g., "**NYTimes.com**", "**Reuters.com**", "**NPR.org**"), then list each article as a bullet under its group: `- [Article Title](URL)`
-- Include ALL source URLs from the research data — do not omit any
-- Meet the target length (within 10%) — the Sources section does not count toward the word count
-- Make it engaging and informative
-
-Return ONLY the article text (headline + body + sources section), no JSON."""
+TARGET LENGTH: {target_length} words"""
 
     try:
         response = anthropic_client.messages.create(
             model=DEFAULT_MODEL,
             max_tokens=4000,
+            system=_ARTICLE_SYSTEM,
             messages=[{"role": "user", "content": prompt}]
         )
 
@@ -383,9 +415,7 @@ Return ONLY a JSON object with this structure:
 
         review_text = response.content[0].text.strip()
         if review_text.startswith("```"):
-            review_text = review_text.split("```")[1]
-            if review_text.startswith("json"):
-                review_text = review_text[4:]
+            review_text = strip_json_codeblocks(review_text)
         review_text = review_text.strip()
 
         review = json.loads(review_text)
@@ -121,6 +121,14 @@ def create_index(force: bool = False):
         except Exception as e:
             print(f"⚠️  ILM policy creation skipped (may require license): {e}")
 
+        # Favor sustained indexing throughput: publishes never force a refresh,
+        # so a new article becomes searchable (Article API, Archivist) up to
+        # refresh_interval after it is acknowledged. The translog keeps its
+        # default per-request durability: this index is the system of record
+        # for published articles. (Serverless manages refresh itself.)
+        index_config.setdefault("settings", {}).setdefault("index", {})
+        index_config["settings"]["index"]["refresh_interval"] = "30s"
+
     # Check if index already exists
     if es.indices.exists(index=index_name):
         print(f"\n⚠️  Index '{index_name}' already exists!")
@@ -6,6 +6,7 @@ It queries Elasticsearch directly to serve published articles to the React UI.
 """
 
 import os
+import re
 from typing import Optional, List
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,6 +22,10 @@ load_env_config()
 # Configure logging
 logger = setup_logger("ARTICLE_API")
 
+# A level-1 or level-2 markdown heading line, and the marker to strip from it
+_HEADING_RE = re.compile(r'^#{1,2}\s+.+')
+_HEADING_MARKER_RE = re.compile(r'^#+\s+')
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Elastic News Article API",
@@ -138,7 +143,6 @@ async def get_article(story_id: str):
 
         # If headline is still "Untitled", try to extract from content
         if headline == 'Untitled' and content and content != 'No content available':
-            import re
             lines = content.split('\n')
             # Priority 1: "HEADLINE: ..." prefix
             headline_line = next((l.strip() for l in lines if l.strip().startswith('HEADLINE:')), None)
@@ -146,9 +150,9 @@ async def get_article(story_id: str):
                 headline = headline_line.replace('HEADLINE:', '').strip()
             else:
                 # Priority 2: First markdown heading (# or ##)
-                heading_line = next((l.strip() for l in lines if re.match(r'^#{1,2}\s+.+', l.strip())), None)
+                heading_line = next((l.strip() for l in lines if _HEADING_RE.match(l.strip())), None)
                 if heading_line:
-                    headline = re.sub(r'^#+\s+', '', heading_line)
+                    headline = _HEADING_MARKER_RE.sub('', heading_line)
 
         logger.info("Article retrieved: %s", headline[:60] if headline else 'N/A')
 
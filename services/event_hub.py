@@ -108,7 +108,7 @@ async def event_stream(request: Request):
 
             logger.info("Sending %d historical events to client", len(historical_events))
         except (ValueError, KeyError) as e:
-            logger.warning(f"Invalid 'since' parameter: {e}")
+            logger.warning("Invalid 'since' parameter: %s", e)
             historical_events = []
     else:
         historical_events = []
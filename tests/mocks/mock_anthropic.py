@@ -2,10 +2,23 @@
 Mock Anthropic client for testing without API calls.
 """
 
-from typing import List, Dict, Any, Optional
+import json
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 
 
+MOCK_OUTLINE = {
+    "outline": "Introduction: Overview of the topic, Background: Historical context and current state, Key Developments: Recent advances and trends, Future Outlook: Predictions and implications",
+    "research_questions": [
+        "What percentage of enterprises are adopting multi-agent AI systems?",
+        "What are the key benefits reported by early adopters?",
+        "Who are the leading companies in this space?",
+        "What are the main technical challenges?",
+        "What is the projected market growth?"
+    ]
+}
+
+
 @dataclass
 class MockTextContent:
     """Mock text content from Anthropic response."""
@@ -13,41 +26,69 @@ class MockTextContent:
     type: str = "text"
 
 
+@dataclass
+class MockToolUseContent:
+    """Mock tool_use content block from Anthropic response."""
+    name: str
+    input: Dict[str, Any]
+    id: str = "toolu_mock"
+    type: str = "tool_use"
+
+
 @dataclass
 class MockMessage:
     """Mock Anthropic message response."""
-    content: List[MockTextContent]
+    content: List[Union[MockTextContent, MockToolUseContent]]
     model: str
     role: str = "assistant"
     stop_reason: str = "end_turn"
 
-    def __init__(self, text: str, model: str = "claude-sonnet-4-6"):
-        self.content = [MockTextContent(text=text)]
+    def __init__(self, text: str = "", model: str = "claude-sonnet-4-6", content: Optional[list] = None, stop_reason: str = "end_turn"):
+        self.content = content if content is not None else [MockTextContent(text=text)]
         self.model = model
+        self.stop_reason = stop_reason
+
+
+def _system_text(system: Union[str, List[Dict[str, Any]], None]) -> str:
+    """Flatten a system prompt (plain string or list of text blocks) to text."""
+    if not system:
+        return ""
+    if isinstance(system, str):
+        return system
+    return "\n".join(block.get("text", "") for block in system)
 
 
 class MockMessages:
     """Mock messages API."""
 
-    def create(self, model: str, max_tokens: int, messages: List[Dict[str, str]]) -> MockMessage:
-        """Create a mock message response based on the prompt."""
+    def create(
+        self,
+        model: str,
+        max_tokens: int,
+        messages: List[Dict[str, str]],
+        system: Union[str, List[Dict[str, Any]], None] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> MockMessage:
+        """Create a mock message response based on the system prompt, prompt and forced tool."""
         user_message = messages[0]["content"] if messages else ""
 
-        # Generate appropriate response based on prompt content
-        if "outline" in user_message.lower() and "research questions" in user_message.lower():
+        # A forced tool call answers with structured tool input, as the API does
+        if tool_choice and tool_choice.get("type") == "tool":
+            return MockMessage(
+                model=model,
+                content=[MockToolUseContent(name=tool_choice["name"], input=dict(MOCK_OUTLINE))],
+                stop_reason="tool_use"
+            )
+
+        # Generate appropriate response based on the instructions and prompt
+        prompt_text = f"{_system_text(system)}\n{user_message}".lower()
+        if "outline" in prompt_text and "research questions" in prompt_text:
             # Outline and research questions
-            response_text = """{
-  "outline": "Introduction: Overview of the topic, Background: Historical context and current state, Key Developments: Recent advances and trends, Future Outlook: Predictions and implications",
-  "research_questions": [
-    "What percentage of enterprises are adopting multi-agent AI systems?",
-    "What are the key benefits reported by early adopters?",
-    "Who are the leading companies in this space?",
-    "What are the main technical challenges?",
-    "What is the projected market growth?"
-  ]
-}"""
-
-        elif "news article" in user_message.lower() or "write a" in user_message.lower():
+            response_text = json.dumps(MOCK_OUTLINE, indent=2)
+
+        elif "news article" in prompt_text or "write a" in prompt_text:
             # Article generation
             topic = "Multi-Agent AI Systems"
             if "Topic:" in user_message:
@@ -70,7 +111,7 @@ Experts predict continued growth in this sector, with enterprise adoption expect
 
 As the technology matures, organizations that successfully implement multi-agent AI systems are positioning themselves for significant competitive advantages in their respective markets."""
 
-        elif "revising your article" in user_message.lower() or "editorial feedback" in user_message.lower():
+        elif "revising your article" in prompt_text or "editorial feedback" in prompt_text:
             # Editorial revisions
             response_text = """HEADLINE: Multi-Agent AI Systems Transform Enterprise Operations
 
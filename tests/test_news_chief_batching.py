@@ -0,0 +1,120 @@
+"""
+Tests for the News Chief's assignment batcher.
+
+Concurrent assignments are queued and sent to the Reporter by a background
+task, at most ASSIGNMENT_BATCH_MAX_SIZE per accept_assignments message; each
+caller awaits its own result. The Reporter A2A client is stubbed, so no agents
+need to be running.
+
+Run with: pytest tests/test_news_chief_batching.py -v
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Importing the agents package builds every agent's server, which needs an MCP URL
+os.environ.setdefault("MCP_SERVER_URL", "http://localhost:8095")
+os.environ.setdefault("EVENT_HUB_ENABLED", "false")
+
+import agents.news_chief as news_chief_module
+from agents.base_agent import response_text
+from agents.news_chief import NewsChiefAgent
+from utils import decode_json, encode_json
+
+
+def _accepted(assignment):
+    return {"status": "success", "story_id": assignment["story_id"], "message": "Assignment accepted"}
+
+
+class FakeReporterClient:
+    """Answers accept_assignment(s) like the Reporter; fail_on names story_ids whose message raises"""
+
+    def __init__(self):
+        self.requests = []
+        self.fail_on = set()
+
+    async def send_message(self, message):
+        request = decode_json(response_text(message))
+        self.requests.append(request)
+        assignments = request.get("assignments") or [request["assignment"]]
+        if self.fail_on.intersection(a["story_id"] for a in assignments):
+            raise ConnectionError("Reporter unreachable")
+
+        if request["action"] == "accept_assignment":
+            reply = _accepted(assignments[0])
+        else:
+            reply = {"status": "success", "results": [_accepted(a) for a in assignments]}
+        yield SimpleNamespace(parts=[SimpleNamespace(root=SimpleNamespace(text=encode_json(reply)))])
+
+
+@pytest.fixture
+def reporter():
+    return FakeReporterClient()
+
+
+@pytest.fixture
+async def agent(monkeypatch, reporter):
+    monkeypatch.setenv("EVENT_HUB_ENABLED", "false")
+
+    chief = NewsChiefAgent()
+
+    async def create_a2a_client(http_client, agent_url, agent_name):
+        return reporter, None
+
+    async def trigger_write(story_id):
+        pass
+
+    monkeypatch.setattr(chief, "_create_a2a_client", create_a2a_client)
+    monkeypatch.setattr(chief, "_trigger_write_async", trigger_write)
+    yield chief
+    await chief.aclose()
+
+
+def _assignment(story_id):
+    return {"story_id": story_id, "topic": f"Topic {story_id}", "target_length": 500}
+
+
+class TestAssignmentBatcher:
+    """NewsChiefAgent._send_to_reporter / _dispatch_assignment_batch"""
+
+    async def test_concurrent_assignments_share_one_message(self, agent, reporter):
+        results = await asyncio.gather(
+            *(agent._send_to_reporter(_assignment(f"story_{i}")) for i in range(3))
+        )
+
+        assert [r["story_id"] for r in results] == ["story_0", "story_1", "story_2"]
+        assert all(r["status"] == "success" for r in results)
+
+        assert len(reporter.requests) == 1
+        assert reporter.requests[0]["action"] == "accept_assignments"
+        assert [a["story_id"] for a in reporter.requests[0]["assignments"]] == ["story_0", "story_1", "story_2"]
+
+    async def test_batches_are_split_at_max_size(self, agent, reporter, monkeypatch):
+        monkeypatch.setattr(news_chief_module, "ASSIGNMENT_BATCH_MAX_SIZE", 2)
+
+        results = await asyncio.gather(
+            *(agent._send_to_reporter(_assignment(f"story_{i}")) for i in range(5))
+        )
+
+        assert [r["story_id"] for r in results] == [f"story_{i}" for i in range(5)]
+        assert [len(r.get("assignments", [None])) for r in reporter.requests] == [2, 2, 1]
+        # A batch of one goes out as a plain accept_assignment
+        assert reporter.requests[-1]["action"] == "accept_assignment"
+
+    async def test_failed_message_only_fails_its_own_batch(self, agent, reporter, monkeypatch):
+        monkeypatch.setattr(news_chief_module, "ASSIGNMENT_BATCH_MAX_SIZE", 2)
+        reporter.fail_on.add("story_bad")
+
+        results = await asyncio.gather(
+            agent._send_to_reporter(_assignment("story_bad")),
+            agent._send_to_reporter(_assignment("story_1")),
+            agent._send_to_reporter(_assignment("story_2")),
+            agent._send_to_reporter(_assignment("story_3")),
+        )
+
+        assert [r["status"] for r in results] == ["error", "error", "success", "success"]
+        assert "Reporter unreachable" in results[0]["message"]
+        assert [r["story_id"] for r in results[2:]] == ["story_2", "story_3"]
@@ -0,0 +1,143 @@
+"""
+Tests for the Publisher's bulk indexer.
+
+Concurrent publishes are queued and flushed by a background task in one
+async_streaming_bulk call; each caller awaits its own per-document result.
+The bulk helper is stubbed, so no Elasticsearch instance is needed.
+
+Run with: pytest tests/test_publisher_indexer.py -v
+"""
+
+import asyncio
+import importlib
+import os
+
+import pytest
+import elasticsearch.helpers
+
+# Importing the agents package builds every agent's server, which needs an MCP URL
+os.environ.setdefault("MCP_SERVER_URL", "http://localhost:8095")
+os.environ.setdefault("EVENT_HUB_ENABLED", "false")
+
+import agents.publisher as publisher_module
+from agents.publisher import PublisherAgent
+
+
+class FakeAsyncElasticsearch:
+    """Only closed by the publisher; every write goes through the stubbed bulk helper"""
+
+    async def close(self):
+        pass
+
+
+def _created(action):
+    op_type = action["_op_type"]
+    result = "created" if op_type == "create" else "updated"
+    return True, {op_type: {"_index": action["_index"], "_id": action["_id"], "status": 201, "result": result}}
+
+
+class BulkRecorder:
+    """Records stubbed bulk requests; outcomes maps a document id to its (ok, item) result"""
+
+    def __init__(self):
+        self.calls = []
+        self.outcomes = {}
+
+    async def streaming_bulk(self, client, actions, **kwargs):
+        actions = list(actions)
+        self.calls.append({"actions": actions, "kwargs": kwargs})
+        for action in actions:
+            yield self.outcomes.get(action["_id"], _created)(action)
+
+
+@pytest.fixture
+def bulk(monkeypatch):
+    recorder = BulkRecorder()
+    monkeypatch.setattr(elasticsearch.helpers, "async_streaming_bulk", recorder.streaming_bulk)
+    return recorder
+
+
+@pytest.fixture
+async def agent(monkeypatch, tmp_path, bulk):
+    monkeypatch.setenv("MCP_SERVER_URL", "http://localhost:8095")
+    monkeypatch.setenv("EVENT_HUB_ENABLED", "false")
+    monkeypatch.setenv("PUBLISHER_ARTICLES_DIR", str(tmp_path))
+    monkeypatch.delenv("ELASTICSEARCH_ENDPOINT", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    publisher = PublisherAgent()
+    publisher.es_client = FakeAsyncElasticsearch()
+    yield publisher
+    await publisher.aclose()
+
+
+class TestBulkIndexer:
+    """Publisher._index_article / _flush_index_batch"""
+
+    async def test_concurrent_publishes_share_one_bulk_request(self, agent, bulk):
+        first, second = await asyncio.gather(
+            agent._index_article("story_1", {"headline": "One"}),
+            agent._index_article("story_2", {"headline": "Two"}),
+        )
+
+        assert first["_id"] == "story_1" and first["result"] == "created"
+        assert second["_id"] == "story_2" and second["result"] == "created"
+
+        assert len(bulk.calls) == 1
+        actions = bulk.calls[0]["actions"]
+        assert [action["_id"] for action in actions] == ["story_1", "story_2"]
+        assert all(action["_op_type"] == "create" for action in actions)
+        assert bulk.calls[0]["kwargs"]["refresh"] is False
+
+    async def test_per_item_failure_only_fails_that_caller(self, agent, bulk):
+        bulk.outcomes["story_bad"] = lambda action: (
+            False, {"create": {"_id": action["_id"], "status": 400, "error": {"type": "mapper_parsing_exception"}}}
+        )
+
+        bad, good = await asyncio.gather(
+            agent._index_article("story_bad", {"headline": "Bad"}),
+            agent._index_article("story_good", {"headline": "Good"}),
+        )
+
+        assert bad is None
+        assert good["_id"] == "story_good"
+
+    async def test_conflict_on_unknown_story_is_not_indexed(self, agent, bulk):
+        bulk.outcomes["story_dup"] = lambda action: (
+            False, {"create": {"_id": action["_id"], "status": 409, "error": {"type": "version_conflict_engine_exception"}}}
+        )
+
+        result = await agent._index_article("story_dup", {"headline": "Again"})
+
+        assert result is None
+
+    async def test_republish_overwrites_known_story(self, agent, bulk):
+        agent._record_publication("story_1", {"story_id": "story_1", "status": "unpublished"})
+
+        result = await agent._index_article("story_1", {"headline": "Revised"})
+
+        assert result["result"] == "updated"
+        assert bulk.calls[0]["actions"][0]["_op_type"] == "index"
+
+    async def test_bulk_request_error_fails_every_caller(self, agent, monkeypatch):
+        async def failing_streaming_bulk(client, actions, **kwargs):
+            raise ConnectionError("cluster unreachable")
+            yield  # pragma: no cover - makes this an async generator
+
+        monkeypatch.setattr(elasticsearch.helpers, "async_streaming_bulk", failing_streaming_bulk)
+
+        results = await asyncio.gather(
+            agent._index_article("story_a", {}),
+            agent._index_article("story_b", {}),
+        )
+
+        assert results == [None, None]
+
+
+def test_bulk_batch_size_is_at_least_one(monkeypatch):
+    monkeypatch.setenv("PUBLISHER_BULK_BATCH_SIZE", "0")
+    try:
+        assert importlib.reload(publisher_module).ES_BULK_CHUNK_SIZE == 1
+    finally:
+        monkeypatch.delenv("PUBLISHER_BULK_BATCH_SIZE")
+        importlib.reload(publisher_module)
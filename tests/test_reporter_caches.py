@@ -0,0 +1,235 @@
+"""
+Tests for the Reporter's outline and Researcher/Archivist result caches.
+
+Outlines are reused for recent assignments with the same target length and
+angle whose topic is a near duplicate (Jaccard similarity of content words at
+or above OUTLINE_CACHE_MIN_SIMILARITY). Successful Researcher and Archivist
+replies are reused for exact repeats, for RESULT_CACHE_TTL_SECONDS and up to
+RESULT_CACHE_MAX_ENTRIES per cache. The MCP client, the other agents and the
+clock are stubbed, so no services are needed.
+
+Run with: pytest tests/test_reporter_caches.py -v
+"""
+
+import os
+
+import pytest
+
+# Importing the agents package builds every agent's server, which needs an MCP URL
+os.environ.setdefault("MCP_SERVER_URL", "http://localhost:8095")
+os.environ.setdefault("EVENT_HUB_ENABLED", "false")
+
+import agents.reporter as reporter_module
+from agents.reporter import ReporterAgent
+from utils import encode_json
+
+
+class FakeClock:
+    """Stands in for the reporter module's time; advance() moves monotonic() forward"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeMCPClient:
+    """Answers generate_outline with an outline naming the request, recording each call"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls.append(arguments)
+        return encode_json({
+            "outline": f"{arguments['topic']} / {arguments['angle']}",
+            "research_questions": ["What changed?"]
+        })
+
+
+class FakeResearcher:
+    """Stands in for the Researcher A2A round trip; replies with status, counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.status = "success"
+
+    async def create_a2a_client(self, http_client, agent_url, agent_name):
+        return self, None
+
+    async def parse_a2a_response(self, client, message):
+        self.calls += 1
+        return {"status": self.status, "research_id": f"research_{self.calls}"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(reporter_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+async def agent(clock):
+    reporter = ReporterAgent()
+    reporter.mcp_client = FakeMCPClient()
+    yield reporter
+    await reporter.aclose()
+
+
+async def _outline(agent, topic, angle="", target_length=1000):
+    return await agent._generate_outline_and_questions(
+        {"topic": topic, "angle": angle, "target_length": target_length}
+    )
+
+
+class TestOutlineCache:
+    """ReporterAgent._generate_outline_and_questions / _lookup_outline"""
+
+    async def test_reworded_topic_reuses_outline(self, agent):
+        first = await _outline(agent, "AI in Healthcare", "economic impact")
+        second = await _outline(agent, "the healthcare AI", "Economic  Impact")
+
+        assert second == first
+        assert len(agent.mcp_client.calls) == 1
+
+    async def test_near_duplicate_topic_reuses_outline(self, agent):
+        # 5 of 6 content words shared: similarity 0.83
+        await _outline(agent, "Climate change policy in Europe 2025")
+        await _outline(agent, "Climate change policy update in Europe 2025")
+
+        assert len(agent.mcp_client.calls) == 1
+
+    async def test_distinct_topic_misses(self, agent):
+        # Only "ai" is shared: similarity 0.33
+        healthcare = await _outline(agent, "AI in healthcare")
+        finance = await _outline(agent, "AI in finance")
+
+        assert finance != healthcare
+        assert len(agent.mcp_client.calls) == 2
+
+    async def test_different_angle_misses(self, agent):
+        economic = await _outline(agent, "AI in healthcare", "economic impact")
+        privacy = await _outline(agent, "AI in healthcare", "patient privacy")
+
+        assert privacy["outline"] == "AI in healthcare / patient privacy"
+        assert privacy != economic
+        assert len(agent.mcp_client.calls) == 2
+
+    async def test_different_target_length_misses(self, agent):
+        await _outline(agent, "AI in healthcare", target_length=1000)
+        await _outline(agent, "AI in healthcare", target_length=500)
+
+        assert len(agent.mcp_client.calls) == 2
+
+    async def test_threshold_is_configurable(self, agent, monkeypatch):
+        monkeypatch.setattr(reporter_module, "OUTLINE_CACHE_MIN_SIMILARITY", 1.0)
+
+        await _outline(agent, "Climate change policy in Europe 2025")
+        await _outline(agent, "Climate change policy update in Europe 2025")
+        await _outline(agent, "Europe 2025: climate change policy")
+
+        # The near duplicate now misses; the exact reordering still hits
+        assert len(agent.mcp_client.calls) == 2
+
+    async def test_expired_outline_misses(self, agent, clock):
+        await _outline(agent, "AI in healthcare")
+        clock.advance(reporter_module.OUTLINE_CACHE_TTL_SECONDS)
+        await _outline(agent, "AI in healthcare")
+
+        assert len(agent.mcp_client.calls) == 2
+
+    async def test_cached_outline_is_a_copy(self, agent):
+        first = await _outline(agent, "AI in healthcare")
+        first["outline"] = "edited by caller"
+
+        second = await _outline(agent, "AI in healthcare")
+
+        assert second["outline"] == "AI in healthcare / "
+
+
+@pytest.fixture
+def researcher(agent, monkeypatch):
+    fake = FakeResearcher()
+    monkeypatch.setattr(agent, "_create_a2a_client", fake.create_a2a_client)
+    monkeypatch.setattr(agent, "_parse_a2a_response", fake.parse_a2a_response)
+    return fake
+
+
+@pytest.fixture
+def archivist_calls(agent, monkeypatch):
+    calls = []
+
+    async def fake_converse(query, story_id, **kwargs):
+        calls.append(query)
+        return {"status": "success", "articles": [query]}
+
+    monkeypatch.setattr(reporter_module, "converse", fake_converse)
+    agent.archivist_agent_url = "http://archivist"
+    agent.archivist_api_key = "test-key"
+    return calls
+
+
+async def _research(agent, topic, questions=("What changed?",)):
+    return await agent._send_to_researcher("story_1", {"topic": topic}, list(questions))
+
+
+class TestResultCaches:
+    """ReporterAgent._get_cached_result / _store_result via _send_to_researcher and _send_to_archivist"""
+
+    async def test_repeat_research_request_is_cached(self, agent, researcher):
+        first = await _research(agent, "AI in healthcare")
+        second = await _research(agent, "AI in healthcare")
+        await _research(agent, "AI in healthcare", ["Who is affected?"])
+
+        assert second == first
+        assert researcher.calls == 2
+
+    async def test_research_reply_expires_after_ttl(self, agent, researcher, clock):
+        await _research(agent, "AI in healthcare")
+        clock.advance(reporter_module.RESULT_CACHE_TTL_SECONDS - 1)
+        await _research(agent, "AI in healthcare")
+        assert researcher.calls == 1
+
+        clock.advance(1)
+        await _research(agent, "AI in healthcare")
+        assert researcher.calls == 2
+
+    async def test_failed_research_reply_is_not_cached(self, agent, researcher):
+        researcher.status = "error"
+        await _research(agent, "AI in healthcare")
+        await _research(agent, "AI in healthcare")
+
+        assert researcher.calls == 2
+        assert len(agent._research_cache) == 0
+
+    async def test_cache_is_bounded_least_recently_used_first(self, agent, researcher, monkeypatch):
+        monkeypatch.setattr(reporter_module, "RESULT_CACHE_MAX_ENTRIES", 2)
+
+        await _research(agent, "topic one")
+        await _research(agent, "topic two")
+        await _research(agent, "topic one")    # hit; now most recently used
+        await _research(agent, "topic three")  # evicts "topic two"
+        assert researcher.calls == 3
+        assert len(agent._research_cache) == 2
+
+        await _research(agent, "topic one")
+        assert researcher.calls == 3
+        await _research(agent, "topic two")
+        assert researcher.calls == 4
+
+    async def test_archive_reply_is_cached_until_ttl(self, agent, archivist_calls, clock):
+        assignment = {"topic": "AI in healthcare", "angle": "economic impact"}
+
+        first = await agent._send_to_archivist("story_1", assignment)
+        second = await agent._send_to_archivist("story_2", assignment)
+        assert second == first
+        assert len(archivist_calls) == 1
+
+        clock.advance(reporter_module.RESULT_CACHE_TTL_SECONDS)
+        await agent._send_to_archivist("story_3", assignment)
+        assert len(archivist_calls) == 2
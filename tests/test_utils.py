@@ -18,6 +18,10 @@ from utils import (
     load_env_config,
     init_anthropic_client,
     extract_json_from_llm_response,
+    strip_json_codeblocks,
+    encode_json,
+    decode_json,
+    JSONDecodeError,
     setup_logger
 )
 
@@ -136,6 +140,36 @@ class TestJsonExtraction:
         result = extract_json_from_llm_response(response, logger)
         assert result is None
 
+    def test_strip_json_codeblocks(self):
+        """Test fence stripping prefers a json fence and leaves plain text alone"""
+        text = 'Notes:\n```\nignored\n```\n```json\n{"key": 1}\n```'
+        assert strip_json_codeblocks(text) == '{"key": 1}'
+        assert strip_json_codeblocks('{"key": 1}') == '{"key": 1}'
+
+
+class TestFastJson:
+    """Tests for the msgspec-backed JSON helpers"""
+
+    def test_round_trip(self):
+        """Test that encode_json/decode_json round-trip a nested payload"""
+        payload = {"action": "assign_story", "story": {"topic": "AI", "target_length": 800, "tags": ["a", "b"]}}
+
+        encoded = encode_json(payload)
+        assert isinstance(encoded, str)
+        assert decode_json(encoded) == payload
+        assert decode_json(encoded.encode()) == payload
+
+    def test_encode_is_compact_and_stdlib_compatible(self):
+        """Test that output is compact JSON readable by the stdlib"""
+        encoded = encode_json({"status": "success", "count": 2})
+        assert encoded == '{"status":"success","count":2}'
+        assert json.loads(encoded) == {"status": "success", "count": 2}
+
+    def test_decode_invalid_json(self):
+        """Test that malformed input raises JSONDecodeError"""
+        with pytest.raises(JSONDecodeError):
+            decode_json('{"action": ')
+
 
 class TestLogger:
     """Tests for logger setup"""
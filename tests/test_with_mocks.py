@@ -9,6 +9,7 @@ These tests run quickly without requiring:
 Run with: pytest tests/test_with_mocks.py -v
 """
 
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -19,6 +20,7 @@ if str(tests_dir) not in sys.path:
     sys.path.insert(0, str(tests_dir))
 
 from mocks import MockAnthropicClient, MockElasticsearchClient
+from mocks.mock_anthropic import MOCK_OUTLINE, MockMessage
 
 
 class TestMockAnthropicClient:
@@ -52,6 +54,37 @@ class TestMockAnthropicClient:
         assert "outline" in response.content[0].text.lower()
         assert "research_questions" in response.content[0].text.lower()
 
+    def test_mock_forced_tool_call(self):
+        """Test mock answers a forced tool call with a tool_use block."""
+        client = MockAnthropicClient()
+
+        response = client.messages.create(
+            model="claude-sonnet-4-6",
+            max_tokens=1000,
+            system=[{"type": "text", "text": "You are a news editor."}],
+            tools=[{"name": "emit_outline", "input_schema": {"type": "object"}}],
+            tool_choice={"type": "tool", "name": "emit_outline"},
+            messages=[{"role": "user", "content": "Topic: AI\nTarget Length: 800 words"}]
+        )
+
+        assert response.stop_reason == "tool_use"
+        assert response.content[0].type == "tool_use"
+        assert response.content[0].name == "emit_outline"
+        assert response.content[0].input["research_questions"]
+
+    def test_mock_article_generation_from_system_prompt(self):
+        """Test mock routes on instructions given in the system prompt."""
+        client = MockAnthropicClient()
+
+        response = client.messages.create(
+            model="claude-sonnet-4-6",
+            max_tokens=2000,
+            system=[{"type": "text", "text": "You are a professional journalist. Write a news article."}],
+            messages=[{"role": "user", "content": "Topic: Multi-Agent AI Systems"}]
+        )
+
+        assert "HEADLINE:" in response.content[0].text
+
     def test_mock_article_generation(self):
         """Test mock generates article content."""
         client = MockAnthropicClient()
@@ -200,6 +233,32 @@ class TestMockElasticsearchClient:
         assert es.indices.exists("test_index") is False
 
 
+class TestNewsroomToolsWithMocks:
+    """Test the MCP newsroom tools against the mock Anthropic client."""
+
+    def test_generate_outline_uses_tool_input(self, monkeypatch):
+        """Test generate_outline returns the forced tool call's input, not the fallback."""
+        from mcp_servers import newsroom_tools
+
+        monkeypatch.setattr(newsroom_tools, "anthropic_client", MockAnthropicClient())
+
+        outline = json.loads(newsroom_tools.generate_outline("AI", "", 800))
+
+        assert outline == MOCK_OUTLINE
+
+    def test_generate_outline_without_tool_call_falls_back(self, monkeypatch):
+        """Test a response without a tool_use block yields the fallback outline instead of raising."""
+        from mcp_servers import newsroom_tools
+
+        client = MockAnthropicClient()
+        monkeypatch.setattr(client.messages, "create", lambda **kwargs: MockMessage(text="No tool call"))
+        monkeypatch.setattr(newsroom_tools, "anthropic_client", client)
+
+        outline = json.loads(newsroom_tools.generate_outline("AI", "", 800))
+
+        assert outline["research_questions"] == ["What are the key facts about AI?"]
+
+
 class TestMockIntegration:
     """Test that mocks work together in integration scenarios."""
 
@@ -5,8 +5,8 @@ Utilities for Elastic News
 from .logging import setup_logger, setup_ui_logger, format_json_for_log, truncate_text
 from .env_loader import load_env_config
 from .anthropic_client import init_anthropic_client
-from .json_utils import extract_json_from_llm_response
-from .server_utils import run_agent_server
+from .json_utils import extract_json_from_llm_response, strip_json_codeblocks, encode_json, encode_json_bytes, decode_json, JSONDecodeError
+from .server_utils import run_agent_server, FastJSONResponse
 from .config import DEFAULT_MODEL
 
 __all__ = [
@@ -17,6 +17,12 @@ __all__ = [
     'load_env_config',
     'init_anthropic_client',
     'extract_json_from_llm_response',
+    'strip_json_codeblocks',
+    'encode_json',
+    'encode_json_bytes',
+    'decode_json',
+    'JSONDecodeError',
     'run_agent_server',
+    'FastJSONResponse',
     'DEFAULT_MODEL'
 ]
@@ -8,6 +8,11 @@ with fallback support.
 import os
 from dotenv import load_dotenv, dotenv_values
 
+# Set in os.environ once .env has been applied, so later calls in this process
+# (every agent module calls load_env_config at import) and child processes
+# that inherit the environment (e.g. uvicorn --reload workers) skip the reparse
+_ENV_LOADED_FLAG = "_ELASTIC_NEWS_ENV_LOADED"
+
 
 def load_env_config():
     """
@@ -18,13 +23,17 @@ def load_env_config():
     2. Falls back to dotenv_values() and manually sets missing values
     
     This is useful for ensuring all agents have access to required configuration
-    regardless of how the environment is set up.
+    regardless of how the environment is set up. The .env file is read only
+    once per process tree; subsequent calls return immediately.
     
     Example:
         >>> from utils import load_env_config
         >>> load_env_config()
         >>> api_key = os.getenv("ANTHROPIC_API_KEY")
     """
+    if os.environ.get(_ENV_LOADED_FLAG):
+        return
+
     # First try load_dotenv() which loads into os.environ
     load_dotenv()
     
@@ -35,3 +44,5 @@ def load_env_config():
         for key, value in env_config.items():
             if value and not os.getenv(key):
                 os.environ[key] = value
+
+    os.environ[_ENV_LOADED_FLAG] = "1"
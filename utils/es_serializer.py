@@ -0,0 +1,69 @@
+"""
+Elasticsearch serializers for Elastic News
+
+msgspec-backed replacements for the Elasticsearch client's stdlib-json
+serializers, so indexed documents (large content and research_data fields)
+are encoded by the same fast JSON backend used on the A2A paths.
+
+Not re-exported from utils/__init__: importing this module loads the
+elasticsearch package, which agents without ES credentials never import.
+"""
+
+from typing import Any, Dict
+
+import msgspec
+from elasticsearch.serializer import (
+    JsonSerializer,
+    NdjsonSerializer,
+    CompatibilityModeJsonSerializer,
+    CompatibilityModeNdjsonSerializer,
+    Serializer,
+)
+
+
+class _MsgspecJsonMixin:
+    """Swap the stdlib json calls of an Elasticsearch JSON serializer for msgspec"""
+
+    def __init__(self) -> None:
+        # Decimals as numbers (not strings) and other non-native types through
+        # the client's default() hook, matching the stdlib serializer's output
+        self._encoder = msgspec.json.Encoder(enc_hook=self.default, decimal_format="number")
+        self._decoder = msgspec.json.Decoder()
+
+    def json_dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def json_loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+class MsgspecJsonSerializer(_MsgspecJsonMixin, JsonSerializer):
+    """application/json serializer backed by msgspec"""
+
+
+class MsgspecNdjsonSerializer(_MsgspecJsonMixin, NdjsonSerializer):
+    """application/x-ndjson (bulk) serializer backed by msgspec"""
+
+
+class MsgspecCompatibilityModeJsonSerializer(_MsgspecJsonMixin, CompatibilityModeJsonSerializer):
+    """Compatibility-mode JSON serializer backed by msgspec"""
+
+
+class MsgspecCompatibilityModeNdjsonSerializer(_MsgspecJsonMixin, CompatibilityModeNdjsonSerializer):
+    """Compatibility-mode NDJSON serializer backed by msgspec"""
+
+
+def msgspec_serializers() -> Dict[str, Serializer]:
+    """
+    Build the serializers= mapping for an Elasticsearch client.
+
+    Returns:
+        Mimetype -> serializer for every JSON/NDJSON content type the client uses
+    """
+    serializers = (
+        MsgspecJsonSerializer(),
+        MsgspecNdjsonSerializer(),
+        MsgspecCompatibilityModeJsonSerializer(),
+        MsgspecCompatibilityModeNdjsonSerializer(),
+    )
+    return {serializer.mimetype: serializer for serializer in serializers}
@@ -8,7 +8,78 @@ markdown formatting, truncation, and malformed JSON.
 import json
 import re
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+import msgspec
+
+# Shared msgspec codecs for hot A2A/HTTP serialization paths (JSON wire format)
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder()
+
+# Raised by decode_json() on malformed input (subclass of ValueError)
+JSONDecodeError = msgspec.DecodeError
+
+
+def encode_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes using msgspec.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON, ready to write to an HTTP response body
+    """
+    return _encoder.encode(data)
+
+
+def encode_json(data: Any) -> str:
+    """
+    Serialize data to a compact JSON string using msgspec.
+
+    Args:
+        data: JSON-serializable object
+
+    Returns:
+        Compact JSON string (A2A text messages require str, not bytes)
+    """
+    return _encoder.encode(data).decode()
+
+
+def decode_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document using msgspec.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON
+    """
+    return _decoder.decode(data)
+
+
+def strip_json_codeblocks(text: str) -> str:
+    """
+    Remove a markdown code fence (```json ... ``` or ``` ... ```) around JSON.
+
+    Uses str.partition, so no intermediate lists are built; text without a
+    fence is returned unchanged.
+
+    Args:
+        text: Text that may contain markdown-wrapped JSON
+
+    Returns:
+        Contents of the first fenced block, or the original text
+    """
+    if "```json" in text:
+        return text.partition("```json")[2].partition("```")[0].strip()
+    if "```" in text:
+        return text.partition("```")[2].partition("```")[0].strip()
+    return text
 
 
 def extract_json_from_llm_response(
@@ -44,10 +115,7 @@ def extract_json_from_llm_response(
     
     try:
         # Try to extract JSON if there's any markdown formatting
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+        response_text = strip_json_codeblocks(response_text)
         
         # Try to find JSON object boundaries if still contains extra text
         if not response_text.startswith("{"):
@@ -61,9 +129,9 @@ def extract_json_from_llm_response(
         try:
             return json.loads(response_text)
         except json.JSONDecodeError as json_err:
-            logger.error(f"JSON parsing failed: {json_err}")
-            logger.error(f"Full JSON response length: {len(response_text)} chars")
-            logger.error(f"Problematic JSON text (first 1000 chars): {response_text[:1000]}")
+            logger.error("JSON parsing failed: %s", json_err)
+            logger.error("Full JSON response length: %s chars", len(response_text))
+            logger.error("Problematic JSON text (first 1000 chars): %s", response_text[:1000])
             
             # Try to fix common JSON issues
             # 1. Remove trailing commas before closing brackets/braces
@@ -88,23 +156,23 @@ def extract_json_from_llm_response(
             # 2. Check if JSON is truncated - if it doesn't end with }, try to close it
             response_text = response_text.strip()
             if not response_text.endswith('}'):
-                logger.warning(f"JSON appears truncated, ends with: {response_text[-50:]}")
+                logger.warning("JSON appears truncated, ends with: %s", response_text[-50:])
                 # Count open braces and brackets
                 open_braces = response_text.count('{') - response_text.count('}')
                 open_brackets = response_text.count('[') - response_text.count(']')
                 
                 # Try to close them
-                logger.info(f"Attempting to close: {open_brackets} unclosed arrays, {open_braces} unclosed objects")
+                logger.info("Attempting to close: %s unclosed arrays, %s unclosed objects", open_brackets, open_braces)
                 response_text += ']' * open_brackets
                 response_text += '}' * open_braces
             
             try:
                 return json.loads(response_text)
             except json.JSONDecodeError as repair_err:
-                logger.error(f"Failed to repair JSON: {repair_err}")
-                logger.error(f"Final attempted JSON (first 1000 chars): {response_text[:1000]}")
+                logger.error("Failed to repair JSON: %s", repair_err)
+                logger.error("Final attempted JSON (first 1000 chars): %s", response_text[:1000])
                 return None
                 
     except Exception as e:
-        logger.error(f"Unexpected error during JSON extraction: {e}")
+        logger.error("Unexpected error during JSON extraction: %s", e)
         return None
@@ -6,12 +6,15 @@ Provides two output modes:
 - JSON: Structured JSON lines for production/Docker (LOG_FORMAT=json)
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
 
 
 # ANSI color codes for terminal output
@@ -85,6 +88,38 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry, default=str)
 
 
+# One background writer per log file, shared by every logger that writes to it:
+# resolved path -> (record queue, listener). Loggers only enqueue records, so
+# file writes never run on the caller's (event loop) thread.
+_file_writers: Dict[str, Tuple[queue.SimpleQueue, logging.handlers.QueueListener]] = {}
+
+
+def _file_writer_queue(log_path: Path) -> queue.SimpleQueue:
+    """Return the record queue for log_path, starting its writer thread on first use"""
+    key = str(log_path.resolve())
+    writer = _file_writers.get(key)
+    if writer is None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_path, mode='a')
+        record_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(record_queue, file_handler)
+        listener.start()
+        writer = _file_writers[key] = (record_queue, listener)
+    return writer[0]
+
+
+def _stop_file_writers():
+    """Drain every writer queue into its file (runs at exit, before logging's own shutdown flush)"""
+    for _, listener in _file_writers.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _file_writers.clear()
+
+
+atexit.register(_stop_file_writers)
+
+
 def setup_logger(
     name: str,
     log_file: str = "logs/newsroom.log",
@@ -121,9 +156,9 @@ def setup_logger(
         f'[{name}] %(asctime)s %(levelname)s: %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(log_path, mode='a')
+    # Records are formatted here (QueueHandler.prepare) and written to the
+    # file by the shared background writer for log_file
+    file_handler = logging.handlers.QueueHandler(_file_writer_queue(Path(log_file)))
     file_handler.setFormatter(file_formatter)
     file_handler.setLevel(level)
     logger.addHandler(file_handler)
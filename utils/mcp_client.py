@@ -6,14 +6,43 @@ Supports both in-process (direct FastMCP instance) and remote (SSE URL) connecti
 Includes optional LLM-based tool selection via Anthropic.
 """
 
+import asyncio
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from anthropic import Anthropic
 from fastmcp import Client as FastMCPClient
 from utils.config import DEFAULT_MODEL
+from utils.json_utils import strip_json_codeblocks
+
+
+# Tool-selection instructions. The tool list is their only variable part, so the
+# formatted text is reused while the tool cache is warm and can be prompt-cached
+_TOOL_SELECTION_SYSTEM_PROMPT = """You are helping select the right MCP tool to accomplish a task.
+
+**Available Tools:**
+{tools_description}
+
+Select the most appropriate tool and provide the arguments needed to call it.
+Respond with a JSON object containing:
+{{
+  "tool_name": "name of the selected tool",
+  "arguments": {{
+    "arg1": "value1",
+    "arg2": "value2"
+  }},
+  "reasoning": "why you selected this tool"
+}}
+
+Provide ONLY the JSON object, no additional text."""
+
+_TOOL_SELECTION_TASK_PROMPT = """**Task Description:**
+{task_description}
+
+**Context:**
+{context}"""
 
 
 class MCPClient:
@@ -44,6 +73,8 @@ class MCPClient:
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
         self._tools_cache_time: Optional[datetime] = None
         self._cache_duration = timedelta(minutes=2)
+        # (tools list, formatted selection prompt) for the current tool cache
+        self._selection_prompt: Optional[Tuple[List[Dict[str, Any]], str]] = None
 
     async def list_tools(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
@@ -115,28 +146,73 @@ class MCPClient:
         try:
             client = FastMCPClient(self.mcp_transport)
             async with client:
-                result = await client.call_tool(tool_name, arguments)
+                return await self._call_on_session(client, tool_name, arguments)
+
+        except Exception as e:
+            if self.logger:
+                self.logger.error("[%s -> MCP] Tool call failed: %s", self.agent_name, e)
+            raise Exception(
+                f"Runtime error: MCP tool '{tool_name}' failed - {e}. "
+                f"The MCP server is REQUIRED for all agent operations."
+            )
 
-                if result.is_error:
-                    error_msg = result.content[0].text if result.content else "Unknown error"
-                    raise Exception(f"Tool returned error: {error_msg}")
+    async def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Call several MCP tools concurrently over a single MCP session.
 
-                # Extract text from the result
-                tool_result = result.content[0].text if result.content else ""
+        Independent calls share one connection and initialize handshake
+        instead of paying for a session each, and run concurrently on it.
 
-                if self.logger:
-                    self.logger.info("[%s -> MCP] Tool %s completed - Result length: %d characters", self.agent_name, tool_name, len(str(tool_result)))
+        Args:
+            calls: List of (tool_name, arguments) pairs
 
-                return tool_result
+        Returns:
+            Tool results in the same order as calls; a call that failed is
+            returned as its Exception rather than raised, so one failure
+            doesn't discard the other results
 
+        Raises:
+            Exception: If the MCP session cannot be established
+        """
+        if self.logger:
+            self.logger.info("[%s -> MCP] Calling tools: %s", self.agent_name, ", ".join(name for name, _ in calls))
+
+        try:
+            client = FastMCPClient(self.mcp_transport)
+            async with client:
+                results = await asyncio.gather(
+                    *(self._call_on_session(client, name, arguments) for name, arguments in calls),
+                    return_exceptions=True
+                )
         except Exception as e:
             if self.logger:
-                self.logger.error("[%s -> MCP] Tool call failed: %s", self.agent_name, e)
+                self.logger.error("[%s -> MCP] Tool session failed: %s", self.agent_name, e)
             raise Exception(
-                f"Runtime error: MCP tool '{tool_name}' failed - {e}. "
+                f"Runtime error: MCP session failed - {e}. "
                 f"The MCP server is REQUIRED for all agent operations."
             )
 
+        for (name, _), result in zip(calls, results):
+            if isinstance(result, Exception) and self.logger:
+                self.logger.error("[%s -> MCP] Tool %s failed: %s", self.agent_name, name, result)
+        return results
+
+    async def _call_on_session(self, client: FastMCPClient, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call one tool on an open FastMCP session and return its text content"""
+        result = await client.call_tool(tool_name, arguments)
+
+        if result.is_error:
+            error_msg = result.content[0].text if result.content else "Unknown error"
+            raise Exception(f"Tool returned error: {error_msg}")
+
+        # Extract text from the result
+        tool_result = result.content[0].text if result.content else ""
+
+        if self.logger:
+            self.logger.info("[%s -> MCP] Tool %s completed - Result length: %d characters", self.agent_name, tool_name, len(str(tool_result)))
+
+        return tool_result
+
     async def select_and_call_tool(self, task_description: str, context: Dict[str, Any]) -> Any:
         """
         Use LLM to select appropriate tool and call it.
@@ -165,53 +241,39 @@ class MCPClient:
         if not tools:
             raise Exception("No MCP tools available")
 
-        # Build tool selection prompt
-        tools_description = "\n".join([
-            f"- {tool['name']}: {tool['description']}"
-            for tool in tools
-        ])
-
-        prompt = f"""You are helping select the right MCP tool to accomplish a task.
-
-**Task Description:**
-{task_description}
-
-**Context:**
-{json.dumps(context, indent=2)}
-
-**Available Tools:**
-{tools_description}
-
-Select the most appropriate tool and provide the arguments needed to call it.
-Respond with a JSON object containing:
-{{
-  "tool_name": "name of the selected tool",
-  "arguments": {{
-    "arg1": "value1",
-    "arg2": "value2"
-  }},
-  "reasoning": "why you selected this tool"
-}}
+        # Build tool selection prompt; the instructions are only re-rendered
+        # when list_tools() returns a fresh tool list
+        if self._selection_prompt is None or self._selection_prompt[0] is not tools:
+            tools_description = "\n".join(
+                f"- {tool['name']}: {tool['description']}"
+                for tool in tools
+            )
+            self._selection_prompt = (tools, _TOOL_SELECTION_SYSTEM_PROMPT.format(tools_description=tools_description))
+        system_prompt = self._selection_prompt[1]
 
-Provide ONLY the JSON object, no additional text."""
+        prompt = _TOOL_SELECTION_TASK_PROMPT.format(
+            task_description=task_description,
+            context=json.dumps(context, indent=2)
+        )
 
         if self.logger:
             self.logger.info("Using LLM to select MCP tool for task: %s", task_description[:100])
 
         try:
-            message = self.anthropic_client.messages.create(
+            # Run the sync Anthropic call in a worker thread so it doesn't block the event loop
+            message = await asyncio.to_thread(
+                self.anthropic_client.messages.create,
                 model=DEFAULT_MODEL,
                 max_tokens=2000,
+                # Static instructions go first and are marked for prompt caching
+                system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
                 messages=[{"role": "user", "content": prompt}]
             )
 
             response_text = message.content[0].text
 
             # Strip markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+            response_text = strip_json_codeblocks(response_text)
 
             selection = json.loads(response_text)
 
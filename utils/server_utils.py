@@ -5,9 +5,26 @@ Provides centralized functions for starting agent servers with uvicorn,
 handling both development (hot reload) and production modes.
 """
 
+import importlib.util
 import logging
 import uvicorn
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+from starlette.responses import JSONResponse
+
+from .json_utils import encode_json_bytes
+
+
+# Prefer uvloop/httptools (C implementations) when installed; fall back to
+# the pure-Python asyncio loop and h11 parser otherwise (e.g. on Windows)
+EVENT_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+HTTP_PROTOCOL = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with msgspec instead of the stdlib json module"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json_bytes(content)
 
 
 def run_agent_server(
@@ -51,7 +68,7 @@ def run_agent_server(
         ... )
     """
     try:
-        logger.info(f'Starting {agent_name} Agent server on {host}:{port}')
+        logger.info('Starting %s Agent server on %s:%s', agent_name, host, port)
         
         # Get emoji based on agent name
         emoji_map = {
@@ -77,13 +94,15 @@ def run_agent_server(
                 host=host,
                 port=port,
                 reload=True,
-                reload_dirs=["./agents"]
+                reload_dirs=["./agents"],
+                loop=EVENT_LOOP,
+                http=HTTP_PROTOCOL
             )
         else:
             app_instance = create_app_func()
-            uvicorn.run(app_instance, host=host, port=port)
+            uvicorn.run(app_instance, host=host, port=port, loop=EVENT_LOOP, http=HTTP_PROTOCOL)
             
     except Exception as e:
-        logger.error(f'An error occurred during server startup: {e}')
+        logger.error('An error occurred during server startup: %s', e)
         print(f"❌ Error starting server: {e}")
         raise